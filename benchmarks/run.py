@@ -0,0 +1,379 @@
+"""Run the pipeline benchmarks and compare them against a stored baseline.
+
+Example::
+
+    python -m benchmarks.run --scale 100000 --output bench_results.json
+    python -m benchmarks.run --scale 10000 --update-baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Mapping, Sequence, Tuple
+from unittest import mock
+
+from benchmarks.synthetic import (
+    StubEncoder,
+    generate_comments,
+    generate_overton_timeline,
+    generate_transcript,
+)
+from src.analysis.audience_pressure import AudiencePressureAnalyzer
+from src.analysis.overton_shift import OvertonTracker
+from src.ingestion.entity_extractor import extract_entities
+from src.ingestion.fact_checker import collect_claims
+from src.ingestion.transcript_parser import parse_transcript, parse_transcript_columns
+from src.models.ideology_mapper import IdeologyMapper
+from src.models.tension_detector import TensionDetector
+
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+TRAINING_SPEC = Path(__file__).resolve().parents[1] / "configs" / "ideology_axes_training.json"
+STUB_ENCODER = StubEncoder()
+
+Runner = Tuple[Callable[[], object], int]
+
+
+class StubIdeologyMapper(IdeologyMapper):
+    @property
+    def encoder(self) -> StubEncoder:
+        return STUB_ENCODER
+
+
+def _trained_mapper() -> StubIdeologyMapper:
+    mapper = StubIdeologyMapper()
+    for axis in json.loads(TRAINING_SPEC.read_text())["axes"]:
+        mapper.add_axis(axis["name"], axis["positive_examples"], axis["negative_examples"])
+    return mapper
+
+
+def _texts(scale: int) -> List[str]:
+    return [segment["text"] for segment in generate_transcript(scale)["segments"]]
+
+
+@contextmanager
+def _parse_transcript(scale: int) -> Iterator[Runner]:
+    raw = generate_transcript(scale)
+    yield lambda: parse_transcript(raw), scale
+
+
+@contextmanager
+def _parse_transcript_columns(scale: int) -> Iterator[Runner]:
+    raw = generate_transcript(scale)
+    yield lambda: parse_transcript_columns(raw), scale
+
+
+@contextmanager
+def _extract_entities(scale: int) -> Iterator[Runner]:
+    transcript = generate_transcript(scale)
+    yield lambda: extract_entities(transcript), scale
+
+
+@contextmanager
+def _collect_claims(scale: int) -> Iterator[Runner]:
+    transcript = generate_transcript(scale)
+    yield lambda: collect_claims(transcript), scale
+
+
+@contextmanager
+def _analyze_exchange(scale: int) -> Iterator[Runner]:
+    texts = _texts(scale)
+    detector = TensionDetector()
+    pairs = list(zip(texts, texts[1:]))
+
+    def run() -> List[object]:
+        return [detector.analyze_exchange(speaker_a, speaker_b) for speaker_a, speaker_b in pairs]
+
+    yield run, len(pairs)
+
+
+@contextmanager
+def _map_speaker(scale: int) -> Iterator[Runner]:
+    mapper = _trained_mapper()
+    quotes = _texts(scale)
+    yield lambda: mapper.map_speaker(quotes), scale
+
+
+@contextmanager
+def _map_speaker_two_tier(scale: int) -> Iterator[Runner]:
+    mapper = _trained_mapper()
+    quotes = _texts(scale)
+    mapper.fit_prescreen(segment["text"] for segment in generate_transcript(1000, seed=1)["segments"])
+    yield lambda: mapper.map_speaker(quotes, two_tier=True), scale
+
+
+@contextmanager
+def _measure_divergence(scale: int) -> Iterator[Runner]:
+    analyzer = AudiencePressureAnalyzer(encoder=STUB_ENCODER)
+    host = _texts(scale)
+    comments = generate_comments(scale)
+    yield lambda: analyzer.measure_divergence(host, comments), 2 * scale
+
+
+@contextmanager
+def _overton_file(scale: int) -> Iterator[Path]:
+    tracker = OvertonTracker()
+    for event in generate_overton_timeline(scale):
+        tracker.add_event(**event)
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "overton.json"
+        tracker.save(path)
+        yield path
+
+
+@contextmanager
+def _overton_load(scale: int) -> Iterator[Runner]:
+    with _overton_file(scale) as path:
+
+        def run() -> OvertonTracker:
+            tracker = OvertonTracker()
+            tracker.load(path)
+            return tracker
+
+        yield run, scale
+
+
+@contextmanager
+def _overton_plot_shift(scale: int) -> Iterator[Runner]:
+    with _overton_file(scale) as path:
+        tracker = OvertonTracker()
+        tracker.load(path)
+        yield lambda: tracker.plot_shift("tariffs").to_json(), scale
+
+
+@contextmanager
+def _overton_plot_shift_lttb(scale: int) -> Iterator[Runner]:
+    with _overton_file(scale) as path:
+        tracker = OvertonTracker()
+        tracker.load(path)
+        yield lambda: tracker.plot_shift("tariffs", freq="weekly", max_points=500).to_json(), scale
+
+
+@contextmanager
+def _api(scale: int) -> Iterator[Tuple[object, Path]]:
+    from fastapi.testclient import TestClient
+
+    from src.deployment import api_server
+    from src.deployment.result_cache import InMemoryBackend, ResultCache
+
+    with ExitStack() as stack, tempfile.TemporaryDirectory() as directory:
+        axes_path = Path(directory) / "axes.json"
+        _trained_mapper().save_axes(axes_path)
+        overton_path = stack.enter_context(_overton_file(scale))
+        stack.enter_context(
+            mock.patch.dict(
+                os.environ,
+                {"IDEOLOGY_AXES_PATH": str(axes_path), "OVERTON_DATA_PATH": str(overton_path)},
+            )
+        )
+        stack.enter_context(mock.patch.object(api_server, "IdeologyMapper", StubIdeologyMapper))
+        stack.enter_context(
+            mock.patch.object(
+                api_server,
+                "AudiencePressureAnalyzer",
+                lambda: AudiencePressureAnalyzer(encoder=STUB_ENCODER),
+            )
+        )
+        # A zero TTL keeps every request on the compute path.
+        stack.enter_context(
+            mock.patch.object(api_server, "result_cache", ResultCache(InMemoryBackend(), ttl=0))
+        )
+        yield TestClient(api_server.app), overton_path
+
+
+def _api_post(path: str, build: Callable[[int], Mapping[str, object]]) -> Callable[[int], object]:
+    @contextmanager
+    def case(scale: int) -> Iterator[Runner]:
+        with _api(scale) as (client, _):
+            payload = build(scale)
+
+            def run() -> None:
+                response = client.post(path, json=payload)
+                response.raise_for_status()
+
+            yield run, 1
+
+    return case
+
+
+@contextmanager
+def _api_overton(scale: int) -> Iterator[Runner]:
+    with _api(scale) as (client, _):
+
+        def run() -> None:
+            client.get("/overton/track/tariffs", params={"max_points": 500}).raise_for_status()
+
+        yield run, 1
+
+
+CASES: Dict[str, Callable[[int], object]] = {
+    "ingestion.parse_transcript": _parse_transcript,
+    "ingestion.parse_transcript_columns": _parse_transcript_columns,
+    "ingestion.extract_entities": _extract_entities,
+    "ingestion.collect_claims": _collect_claims,
+    "tension.analyze_exchange": _analyze_exchange,
+    "ideology.map_speaker": _map_speaker,
+    "ideology.map_speaker_two_tier": _map_speaker_two_tier,
+    "audience.measure_divergence": _measure_divergence,
+    "overton.load": _overton_load,
+    "overton.plot_shift": _overton_plot_shift,
+    "overton.plot_shift_weekly_lttb": _overton_plot_shift_lttb,
+    "api.tension_detect": _api_post(
+        "/tension/detect",
+        lambda scale: {
+            "speaker_a": " ".join(_texts(min(scale, 1000))),
+            "speaker_b": " ".join(reversed(_texts(min(scale, 1000)))),
+        },
+    ),
+    "api.audience_pressure": _api_post(
+        "/audience/pressure",
+        lambda scale: {"host_statements": _texts(scale), "audience_comments": generate_comments(scale)},
+    ),
+    "api.analyze_ideology": _api_post(
+        "/analyze/ideology", lambda scale: {"name": "Dave", "quotes": _texts(scale)}
+    ),
+    "api.overton_track": _api_overton,
+}
+
+
+# Cases that hold dense (items × 384) stub embeddings or a whole JSON payload in
+# memory are capped so large --scale runs stay within RAM.
+CASE_MAX_SCALE: Dict[str, int] = {
+    "ideology.map_speaker": 100_000,
+    "ideology.map_speaker_two_tier": 100_000,
+    "audience.measure_divergence": 100_000,
+    "api.audience_pressure": 20_000,
+    "api.analyze_ideology": 20_000,
+}
+
+
+def _measure_memory(run: Callable[[], object]) -> Dict[str, float]:
+    """Peak and retained (result-held) traced allocations of one extra run."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        result = run()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return {"peak_kib": (peak - before) / 1024, "retained_kib": (current - before) / 1024}
+
+
+def run_benchmarks(
+    scale: int, repeat: int = 3, cases: Sequence[str] | None = None, memory: bool = False
+) -> Dict[str, object]:
+    """Time each selected case ``repeat`` times on ``scale`` synthetic items.
+
+    Cases listed in ``CASE_MAX_SCALE`` run at no more than their cap; the
+    scale actually used is reported per case. With ``memory`` each case runs
+    once more under tracemalloc to record its peak and retained allocations.
+    """
+    selected = [
+        name for name in CASES if not cases or any(name.startswith(prefix) for prefix in cases)
+    ]
+    results: Dict[str, Dict[str, float]] = {}
+    for name in selected:
+        case_scale = min(scale, CASE_MAX_SCALE.get(name, scale))
+        with CASES[name](case_scale) as (run, items):
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                run()
+                timings.append(time.perf_counter() - started)
+            usage = _measure_memory(run) if memory else {}
+        best = min(timings)
+        results[name] = {
+            "scale": case_scale,
+            "best_seconds": best,
+            "median_seconds": statistics.median(timings),
+            "items": items,
+            "items_per_second": items / best if best > 0 else float("inf"),
+            **usage,
+        }
+    return {
+        "meta": {
+            "scale": scale,
+            "repeat": repeat,
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "timestamp": time.time(),
+        },
+        "results": results,
+    }
+
+
+def find_regressions(
+    report: Mapping[str, object], baseline: Mapping[str, Mapping[str, float]], threshold: float
+) -> List[str]:
+    """List cases whose best time exceeds the baseline for this scale by more than ``threshold``.
+
+    Raises ``LookupError`` when no baseline was recorded at the report's scale,
+    so an unchecked run cannot pass silently.
+    """
+    scale = str(report["meta"]["scale"])
+    if scale not in baseline:
+        raise LookupError(f"No baseline recorded at scale {scale}; record one with --update-baseline.")
+    reference = baseline[scale]
+    regressions = []
+    for name, result in report["results"].items():
+        if name not in reference:
+            continue
+        ratio = result["best_seconds"] / reference[name]
+        if ratio > 1.0 + threshold:
+            regressions.append(
+                f"{name}: {result['best_seconds']:.4f}s vs baseline {reference[name]:.4f}s ({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the discourse analysis pipeline")
+    parser.add_argument("--scale", type=int, default=10_000, help="Synthetic segments/events per case")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--cases", nargs="*", default=None, help="Case name prefixes to run")
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE))
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown fraction")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--memory", action="store_true", help="Also record peak/retained allocations")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.scale, repeat=args.repeat, cases=args.cases, memory=args.memory)
+    Path(args.output).write_text(json.dumps(report, indent=2))
+    for name, result in report["results"].items():
+        memory = f" {result['retained_kib']:12.0f} KiB held" if "retained_kib" in result else ""
+        print(f"{name:34s} {result['best_seconds']:10.4f}s {result['items_per_second']:14.1f} items/s{memory}")
+
+    baseline_path = Path(args.baseline)
+    baseline = json.loads(baseline_path.read_text()) if baseline_path.exists() else {}
+    if args.update_baseline:
+        baseline.setdefault(str(args.scale), {}).update(
+            {name: result["best_seconds"] for name, result in report["results"].items()}
+        )
+        baseline_path.write_text(json.dumps(baseline, indent=2, sort_keys=True))
+        return 0
+
+    try:
+        regressions = find_regressions(report, baseline, args.threshold)
+    except LookupError as exc:
+        print(f"ERROR {exc}", file=sys.stderr)
+        return 2
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,110 @@
+"""Deterministic synthetic data and a stub encoder for offline benchmarks."""
+
+from __future__ import annotations
+
+import random
+import zlib
+from datetime import datetime, timedelta
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+
+SPEAKERS = ["Dave", "Nick", "Tucker", "Candace", "Ben", "Destiny"]
+ENTITIES = ["Austin", "Texas", "Ukraine", "Israel", "Congress", "Fox News", "Twitter", "New York"]
+FILLER = [
+    "Welcome to the show.",
+    "Thanks for having me.",
+    "That's a great question.",
+    "Let me finish my point.",
+]
+CLAIMS = [
+    "According to reports, {entity} increased aid last year.",
+    "A new study says {entity} is losing support.",
+    "{entity} reports record numbers this quarter.",
+]
+TENSE = [
+    "You're a liar and everyone in {entity} knows it.",
+    "That is disgusting and frankly dishonest.",
+    "I disagree, but fair point about {entity}.",
+    "You're right that {entity} was unfair to us.",
+]
+COMMENTS = [
+    "great episode",
+    "he is a traitor to {entity}",
+    "war now, all of them",
+    "respectful debate for once",
+    "{entity} will never learn",
+]
+CONSEQUENCES = [
+    "deplatformed",
+    "coordinated_attack",
+    "controversy",
+    "debate",
+    "tepid_agreement",
+    "mainstream_adoption",
+    "consensus",
+]
+PLATFORMS = ["youtube", "x", "podcast", "cable"]
+TOPICS = ["tariffs", "immigration", "foreign aid", "free speech"]
+
+
+def _statement(rng: random.Random) -> str:
+    roll = rng.random()
+    pool = FILLER if roll < 0.4 else CLAIMS if roll < 0.6 else TENSE
+    return rng.choice(pool).format(entity=rng.choice(ENTITIES))
+
+
+def generate_transcript(n_segments: int, seed: int = 0) -> Dict[str, List[Dict[str, object]]]:
+    rng = random.Random(seed)
+    segments = []
+    timestamp = 0.0
+    for _ in range(n_segments):
+        timestamp += rng.uniform(1.0, 20.0)
+        segments.append(
+            {"speaker": rng.choice(SPEAKERS), "timestamp": round(timestamp, 2), "text": _statement(rng)}
+        )
+    return {"segments": segments}
+
+
+def generate_comments(n_comments: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    return [rng.choice(COMMENTS).format(entity=rng.choice(ENTITIES)) for _ in range(n_comments)]
+
+
+def generate_overton_timeline(n_events: int, seed: int = 0) -> List[Dict[str, str]]:
+    rng = random.Random(seed)
+    start = datetime(2020, 1, 1)
+    return [
+        {
+            "date": (start + timedelta(minutes=rng.randrange(5 * 365 * 24 * 60))).isoformat(),
+            "statement": f"{rng.choice(SPEAKERS)} on {rng.choice(TOPICS)}: {_statement(rng)}",
+            "platform": rng.choice(PLATFORMS),
+            "reaction": rng.choice(["cheers", "boos", "mixed"]),
+            "consequence": rng.choice(CONSEQUENCES),
+        }
+        for _ in range(n_events)
+    ]
+
+
+class StubEncoder:
+    """Deterministic bag-of-hashed-words encoder with the SentenceTransformer ``encode`` shape."""
+
+    def __init__(self, dim: int = 384) -> None:
+        self.dim = dim
+
+    def encode(self, sentences: Sequence[str]) -> np.ndarray:
+        embeddings = np.zeros((len(sentences), self.dim), dtype=np.float32)
+        for row, sentence in enumerate(sentences):
+            for token in sentence.lower().split():
+                bucket = zlib.crc32(token.encode()) % (2 * self.dim)
+                embeddings[row, bucket % self.dim] += 1.0 if bucket < self.dim else -1.0
+        return embeddings
+
+
+__all__ = [
+    "StubEncoder",
+    "generate_comments",
+    "generate_overton_timeline",
+    "generate_transcript",
+]
@@ -6,20 +6,28 @@ saved to `decoherence_samples.csv` and plotted for quick inspection.
 
 Run with:
     python deco_sim.py
+
+For shader lookup tables, sweep a whole gamma × t_max grid headlessly and
+write a float32 table the shader can upload directly:
+    python deco_sim.py --sweep --gamma 0.05 1.0 64 --t-max 1.0 12.0 16 \
+        --samples 256 --output decoherence_lut.npy
+    python deco_sim.py --sweep --format f32 --output decoherence_lut.f32
 """
 
 from __future__ import annotations
 
-import csv
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Tuple
+from typing import Iterable, Sequence, Tuple
 
 import numpy as np
 
 try:
-    from qutip import Qobj, basis, mesolve
-    from qutip.operators import sigmax, sigmaz
+    from qutip import Qobj, basis, mesolve, sigmax, sigmaz
 except Exception:  # pragma: no cover - optional dependency fallback
     Qobj = None
     basis = None
@@ -27,8 +35,6 @@ except Exception:  # pragma: no cover - optional dependency fallback
     sigmax = None
     sigmaz = None
 
-import matplotlib.pyplot as plt
-
 
 @dataclass
 class PhaseDampingConfig:
@@ -68,14 +74,116 @@ def simulate_analytical(cfg: PhaseDampingConfig) -> SimulationResult:
 
 
 def export_csv(times: Iterable[float], rho01: Iterable[complex], path: Path) -> None:
-    with path.open("w", newline="") as fh:
-        writer = csv.writer(fh)
-        writer.writerow(["time", "real", "imag", "magnitude"])
-        for t, c in zip(times, rho01):
-            writer.writerow([f"{t:.6f}", f"{c.real:.6f}", f"{c.imag:.6f}", f"{abs(c):.6f}"])
+    times = np.asarray(times, dtype=float)
+    rho01 = np.asarray(rho01, dtype=complex)
+    columns = np.column_stack([times, rho01.real, rho01.imag, np.abs(rho01)])
+    np.savetxt(path, columns, fmt="%.6f", delimiter=",", header="time,real,imag,magnitude", comments="")
+
+
+@dataclass
+class SweepResult:
+    gammas: np.ndarray
+    t_maxes: np.ndarray
+    samples: int
+    magnitude: np.ndarray  # |rho01|, shape (len(gammas), len(t_maxes), samples)
+
+
+def sweep_analytical(gammas: Sequence[float], t_maxes: Sequence[float], samples: int) -> SweepResult:
+    """Evaluate |rho01| = 0.5·exp(-γt) for every (γ, t_max) pair in one broadcast.
 
+    Sample ``k`` of row ``(i, j)`` sits at ``t = t_maxes[j] * k / (samples - 1)``,
+    matching ``simulate_analytical`` for that configuration.
+    """
+    gammas = np.asarray(gammas, dtype=np.float32)
+    t_maxes = np.asarray(t_maxes, dtype=np.float32)
+    unit_times = np.linspace(0.0, 1.0, samples, dtype=np.float32)
+    exponent = gammas[:, None, None] * t_maxes[None, :, None] * unit_times[None, None, :]
+    magnitude = 0.5 * np.exp(-exponent)
+    return SweepResult(gammas=gammas, t_maxes=t_maxes, samples=samples, magnitude=magnitude)
+
+
+def _qutip_magnitude(cfg: PhaseDampingConfig) -> np.ndarray:
+    return np.abs(simulate_with_qutip(cfg).rho01).astype(np.float32)
+
+
+def sweep_with_qutip(
+    gammas: Sequence[float], t_maxes: Sequence[float], samples: int, workers: int | None = None
+) -> SweepResult:
+    """Solve the Lindblad equation for every grid point on a process pool."""
+    if mesolve is None:
+        raise RuntimeError("QuTiP is not available. Install it with `pip install qutip`." )
+    gammas = np.asarray(gammas, dtype=np.float32)
+    t_maxes = np.asarray(t_maxes, dtype=np.float32)
+    configs = [
+        PhaseDampingConfig(gamma=float(gamma), t_max=float(t_max), samples=samples)
+        for gamma in gammas
+        for t_max in t_maxes
+    ]
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        curves = list(pool.map(_qutip_magnitude, configs, chunksize=max(1, len(configs) // 64)))
+    magnitude = np.stack(curves).reshape(len(gammas), len(t_maxes), samples)
+    return SweepResult(gammas=gammas, t_maxes=t_maxes, samples=samples, magnitude=magnitude)
+
+
+def export_table(result: SweepResult, path: Path, fmt: str = "npy") -> Path:
+    """Write the sweep as float32 ``.npy`` or a raw little-endian R32F texture.
+
+    Returns the path actually written (``.npy`` is appended when missing).
+
+    The raw layout is row-major ``(gamma, t_max, sample)``: a 2D texture of
+    width ``samples`` and height ``len(gammas) * len(t_maxes)``, or a 3D
+    texture of depth ``len(gammas)``. A ``.json`` sidecar records the axes.
+    """
+    table = np.ascontiguousarray(result.magnitude, dtype="<f4")
+    if fmt == "npy":
+        if path.suffix != ".npy":  # np.save would append it anyway
+            path = path.with_name(path.name + ".npy")
+        np.save(path, table)
+    elif fmt == "f32":
+        table.tofile(path)
+    else:
+        raise ValueError(f"Unsupported table format '{fmt}'; expected 'npy' or 'f32'.")
+    metadata = {
+        "format": "R32F",
+        "layout": ["gamma", "t_max", "sample"],
+        "width": result.samples,
+        "height": len(result.t_maxes),
+        "depth": len(result.gammas),
+        "gammas": result.gammas.tolist(),
+        "t_maxes": result.t_maxes.tolist(),
+    }
+    path.with_suffix(".json").write_text(json.dumps(metadata, indent=2))
+    return path
+
+
+def run_sweep(args: argparse.Namespace) -> SweepResult:
+    gammas = np.linspace(args.gamma[0], args.gamma[1], int(args.gamma[2]))
+    t_maxes = np.linspace(args.t_max[0], args.t_max[1], int(args.t_max[2]))
+    if args.backend == "qutip" or (args.backend == "auto" and mesolve is not None):
+        result = sweep_with_qutip(gammas, t_maxes, args.samples, workers=args.workers)
+    else:
+        result = sweep_analytical(gammas, t_maxes, args.samples)
+    path = export_table(result, Path(args.output or f"decoherence_lut.{args.format}"), fmt=args.format)
+    print(f"Saved {result.magnitude.shape} float32 table to {path}")
+    return result
+
+
+def main(argv: Sequence[str] | None = None) -> Tuple[SimulationResult, SimulationResult] | SweepResult:
+    parser = argparse.ArgumentParser(description="Phase damping simulation and shader table export")
+    parser.add_argument("--sweep", action="store_true", help="Headless gamma × t_max sweep")
+    parser.add_argument("--gamma", nargs=3, type=float, default=[0.05, 1.0, 64], metavar=("MIN", "MAX", "STEPS"))
+    parser.add_argument("--t-max", nargs=3, type=float, default=[1.0, 12.0, 16], metavar=("MIN", "MAX", "STEPS"))
+    parser.add_argument("--samples", type=int, default=256)
+    parser.add_argument("--backend", choices=["auto", "analytical", "qutip"], default="analytical")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--format", choices=["npy", "f32"], default="npy")
+    parser.add_argument("--output", default=None, help="Defaults to decoherence_lut.<format>")
+    parser.add_argument("--no-show", action="store_true", help="Skip the interactive plot")
+    args = parser.parse_args(argv)
+
+    if args.sweep:
+        return run_sweep(args)
 
-def main() -> Tuple[SimulationResult, SimulationResult]:
     cfg = PhaseDampingConfig()
     qutip_result: SimulationResult
 
@@ -93,6 +201,17 @@ def main() -> Tuple[SimulationResult, SimulationResult]:
     export_csv(qutip_result.times, qutip_result.rho01, csv_path)
     print(f"Saved sample curve to {csv_path.relative_to(Path.cwd())}")
 
+    decoherence_time = 1.0 / cfg.gamma
+    print(f"Decoherence 1/e time: {decoherence_time:.2f} time units")
+    if not args.no_show:
+        _plot(qutip_result, analytic_result)
+
+    return qutip_result, analytic_result
+
+
+def _plot(qutip_result: SimulationResult, analytic_result: SimulationResult) -> None:
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(7.5, 4.2))
     plt.plot(qutip_result.times, np.abs(qutip_result.rho01), label="|rho01| (simulated)", linewidth=2.2)
     plt.plot(analytic_result.times, np.abs(analytic_result.rho01), label="|rho01| = 0.5·exp(-γt)", linestyle="--")
@@ -104,11 +223,6 @@ def main() -> Tuple[SimulationResult, SimulationResult]:
     plt.tight_layout()
     plt.show()
 
-    decoherence_time = 1.0 / cfg.gamma
-    print(f"Decoherence 1/e time: {decoherence_time:.2f} time units")
-
-    return qutip_result, analytic_result
-
 
 if __name__ == "__main__":
     main()
@@ -2,30 +2,38 @@
 
 from __future__ import annotations
 
-import importlib
 from dataclasses import dataclass
-from typing import Iterable, List, Sequence
+from typing import TYPE_CHECKING, Dict, Iterable, List, Sequence
 
 import numpy as np
 
+from src.models.encoders import load_sentence_encoder
+from src.observability.tracing import span
 
-if importlib.util.find_spec("sentence_transformers") is None:  # pragma: no cover
-    raise ImportError("The 'sentence_transformers' package is required for AudiencePressureAnalyzer.")
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from sentence_transformers import SentenceTransformer
 
-from sentence_transformers import SentenceTransformer
 
-
-@dataclass
+@dataclass(slots=True)
 class PressureReport:
     divergence_score: float
     audience_pull_direction: str
     audience_extreme_score: float
     host_extreme_score: float
 
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "divergence_score": self.divergence_score,
+            "audience_pull_direction": self.audience_pull_direction,
+            "audience_extreme_score": self.audience_extreme_score,
+            "host_extreme_score": self.host_extreme_score,
+        }
+
 
 class AudiencePressureAnalyzer:
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2") -> None:
-        self.encoder = SentenceTransformer(model_name)
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", encoder: SentenceTransformer | None = None) -> None:
+        self.model_name = model_name
+        self._encoder = encoder
         self.extreme_keywords = [
             "nazi",
             "kill",
@@ -34,20 +42,30 @@ class AudiencePressureAnalyzer:
             "traitor",
         ]
 
+    @property
+    def encoder(self) -> SentenceTransformer:
+        if self._encoder is None:
+            with span("audience.load_encoder"):
+                self._encoder = load_sentence_encoder(self.model_name, required_by="AudiencePressureAnalyzer")
+        return self._encoder
+
     def _encode(self, sentences: Sequence[str]) -> np.ndarray:
         if not sentences:
             raise ValueError("At least one sentence is required for encoding.")
-        return self.encoder.encode(list(sentences))
+        encoder = self.encoder
+        with span("audience.encode"):
+            return encoder.encode(list(sentences))
 
     def _extreme_score(self, sentences: Iterable[str]) -> float:
         sentences = list(sentences)
         if not sentences:
             return 0.0
         hits = 0
-        for sentence in sentences:
-            lower = sentence.lower()
-            if any(keyword in lower for keyword in self.extreme_keywords):
-                hits += 1
+        with span("audience.keywords"):
+            for sentence in sentences:
+                lower = sentence.lower()
+                if any(keyword in lower for keyword in self.extreme_keywords):
+                    hits += 1
         return hits / len(sentences)
 
     def measure_divergence(
@@ -56,9 +74,10 @@ class AudiencePressureAnalyzer:
         host_embeddings = self._encode(host_statements)
         audience_embeddings = self._encode(audience_comments)
 
-        host_centroid = host_embeddings.mean(axis=0)
-        audience_centroid = audience_embeddings.mean(axis=0)
-        distance = np.linalg.norm(host_centroid - audience_centroid)
+        with span("audience.centroids"):
+            host_centroid = host_embeddings.mean(axis=0)
+            audience_centroid = audience_embeddings.mean(axis=0)
+            distance = np.linalg.norm(host_centroid - audience_centroid)
 
         host_extreme = self._extreme_score(host_statements)
         audience_extreme = self._extreme_score(audience_comments)
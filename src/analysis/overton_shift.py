@@ -2,16 +2,61 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Iterable, List, Sequence
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 
+from src.observability.tracing import traced
 
-@dataclass
+
+RESAMPLE_FREQUENCIES = {"daily": "D", "weekly": "W"}
+
+
+def lttb_indices(x: Sequence[float], y: Sequence[float], threshold: int) -> np.ndarray:
+    """Select ``threshold`` shape-preserving points (Largest-Triangle-Three-Buckets)."""
+    x_arr = np.asarray(x, dtype=float)
+    y_arr = np.asarray(y, dtype=float)
+    n = len(x_arr)
+    if threshold < 3:
+        raise ValueError("LTTB downsampling requires a threshold of at least 3 points.")
+    if threshold >= n:
+        return np.arange(n)
+
+    bucket_size = (n - 2) / (threshold - 2)
+    selected = np.empty(threshold, dtype=int)
+    selected[0] = 0
+    anchor = 0
+    for bucket in range(threshold - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+        next_end = min(int((bucket + 2) * bucket_size) + 1, n)
+        avg_x = x_arr[end:next_end].mean()
+        avg_y = y_arr[end:next_end].mean()
+        areas = np.abs(
+            (x_arr[anchor] - avg_x) * (y_arr[start:end] - y_arr[anchor])
+            - (x_arr[anchor] - x_arr[start:end]) * (avg_y - y_arr[anchor])
+        )
+        anchor = start + int(np.argmax(areas))
+        selected[bucket + 1] = anchor
+    selected[-1] = n - 1
+    return selected
+
+
+@traced("overton.lttb")
+def _lttb_frame(frame: pd.DataFrame, y_column: str, max_points: int | None) -> pd.DataFrame:
+    if max_points is None or len(frame) <= max_points:
+        return frame
+    x = frame["date"].to_numpy(dtype="datetime64[ns]").astype("int64") / 1e9
+    return frame.iloc[lttb_indices(x, frame[y_column].to_numpy(), max_points)]
+
+
+@dataclass(slots=True)
 class OvertonEvent:
     date: datetime
     statement: str
@@ -56,34 +101,112 @@ class OvertonTracker:
             )
         )
 
+    @traced("overton.frame")
     def to_frame(self) -> pd.DataFrame:
-        return pd.DataFrame([
+        if not self.timeline:
+            return pd.DataFrame()
+        timeline = self.timeline
+        return pd.DataFrame(
             {
-                "date": event.date,
-                "statement": event.statement,
-                "platform": event.platform,
-                "reaction": event.reaction,
-                "consequence": event.consequence,
-                "overton_score": event.score,
+                "date": pd.DatetimeIndex([event.date for event in timeline]),
+                "statement": [event.statement for event in timeline],
+                "platform": [event.platform for event in timeline],
+                "reaction": [event.reaction for event in timeline],
+                "consequence": [event.consequence for event in timeline],
+                "overton_score": np.fromiter((event.score for event in timeline), float, len(timeline)),
             }
-            for event in self.timeline
-        ])
+        )
 
-    def plot_shift(self, topic: str) -> go.Figure:
+    def topic_frame(self, topic: str) -> pd.DataFrame:
         frame = self.to_frame()
+        if frame.empty:
+            return frame
         mask = frame["statement"].str.contains(topic, case=False, na=False)
-        topic_frame = frame.loc[mask].sort_values("date")
-        fig = go.Figure()
-        fig.add_trace(
-            go.Scatter(
-                x=topic_frame["date"],
-                y=topic_frame["overton_score"],
-                mode="lines+markers",
-                text=topic_frame["statement"],
-                hovertemplate="%{text}<br>%{x|%Y-%m-%d}: %{y}",
-                name=topic,
+        return frame.loc[mask].sort_values("date")
+
+    @traced("overton.resample")
+    def resample(self, topic: str, freq: str = "daily", window: int | None = None) -> pd.DataFrame:
+        """Bucket a topic's scores per platform into daily/weekly mean/min/max.
+
+        ``window`` adds a ``rolling_mean`` column computed over that many
+        non-empty buckets of the same platform.
+        """
+        if freq not in RESAMPLE_FREQUENCIES:
+            raise ValueError(
+                f"Unsupported resample frequency '{freq}'; expected one of {sorted(RESAMPLE_FREQUENCIES)}."
             )
+        if window is not None and window < 1:
+            raise ValueError("Rolling window must span at least one bucket.")
+
+        columns = ["platform", "date", "mean", "min", "max", "count"]
+        if window is not None:
+            columns.append("rolling_mean")
+        topic_frame = self.topic_frame(topic)
+        if topic_frame.empty:
+            return pd.DataFrame(columns=columns)
+
+        buckets = (
+            topic_frame.set_index("date")
+            .groupby("platform")["overton_score"]
+            .resample(RESAMPLE_FREQUENCIES[freq])
+            .agg(["mean", "min", "max", "count"])
+            .reset_index()
         )
+        buckets = buckets.loc[buckets["count"] > 0].sort_values(["platform", "date"])
+        if window is not None:
+            buckets["rolling_mean"] = buckets.groupby("platform")["mean"].transform(
+                lambda series: series.rolling(window, min_periods=1).mean()
+            )
+        return buckets.reset_index(drop=True)[columns]
+
+    @traced("overton.plot")
+    def plot_shift(
+        self,
+        topic: str,
+        freq: str | None = None,
+        window: int | None = None,
+        max_points: int | None = None,
+    ) -> go.Figure:
+        """Plot a topic's Overton trajectory.
+
+        Without ``freq`` every matching event is plotted; with ``freq`` one
+        trace per platform shows bucketed means (or the rolling mean when
+        ``window`` is set). ``max_points`` caps each trace via LTTB.
+        """
+        fig = go.Figure()
+        if freq is None:
+            if window is not None:
+                raise ValueError("A rolling window requires a resample frequency.")
+            topic_frame = _lttb_frame(self.topic_frame(topic), "overton_score", max_points)
+            fig.add_trace(
+                go.Scatter(
+                    x=topic_frame["date"],
+                    y=topic_frame["overton_score"],
+                    mode="lines+markers",
+                    text=topic_frame["statement"],
+                    hovertemplate="%{text}<br>%{x|%Y-%m-%d}: %{y}",
+                    name=topic,
+                )
+            )
+        else:
+            buckets = self.resample(topic, freq=freq, window=window)
+            y_column = "rolling_mean" if window is not None else "mean"
+            for platform, platform_frame in buckets.groupby("platform", sort=True):
+                platform_frame = _lttb_frame(platform_frame, y_column, max_points)
+                fig.add_trace(
+                    go.Scatter(
+                        x=platform_frame["date"],
+                        y=platform_frame[y_column],
+                        mode="lines+markers",
+                        customdata=platform_frame[["min", "max", "count"]].to_numpy(),
+                        hovertemplate=(
+                            "%{x|%Y-%m-%d}: %{y:.2f}"
+                            "<br>min %{customdata[0]:.2f} / max %{customdata[1]:.2f}"
+                            "<br>%{customdata[2]} events"
+                        ),
+                        name=f"{topic} ({platform})",
+                    )
+                )
         fig.update_layout(
             title=f"Overton Window Shift: {topic}",
             xaxis_title="Date",
@@ -96,19 +219,23 @@ class OvertonTracker:
         frame = self.to_frame()
         frame.to_json(path, orient="records", date_format="iso")
 
+    @traced("overton.load")
     def load(self, path: str | Path) -> None:
         frame = pd.read_json(path)
+        if frame.empty:
+            self.timeline = []
+            return
         self.timeline = [
-            OvertonEvent(
-                date=pd.to_datetime(row["date"]),
-                statement=row["statement"],
-                platform=row["platform"],
-                reaction=row["reaction"],
-                consequence=row["consequence"],
-                score=float(row["overton_score"]),
+            OvertonEvent(*row)
+            for row in zip(
+                pd.to_datetime(frame["date"]),
+                frame["statement"].tolist(),
+                frame["platform"].map(sys.intern).tolist(),
+                frame["reaction"].tolist(),
+                frame["consequence"].map(sys.intern).tolist(),
+                frame["overton_score"].astype(float).tolist(),
             )
-            for row in frame.to_dict(orient="records")
         ]
 
 
-__all__ = ["OvertonTracker", "OvertonEvent"]
+__all__ = ["OvertonTracker", "OvertonEvent", "RESAMPLE_FREQUENCIES", "lttb_indices"]
@@ -2,17 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
+import hmac
 import os
-from typing import Dict, List
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+from fastapi import FastAPI, Header, HTTPException, Query, Request, Response
+from fastapi.responses import JSONResponse, PlainTextResponse
+from pydantic import BaseModel, Field
 
-from src.analysis.overton_shift import OvertonTracker
 from src.analysis.audience_pressure import AudiencePressureAnalyzer
 from src.models.ideology_mapper import IdeologyMapper
 from src.models.tension_detector import TensionDetector
 from src.models.reconciliation_engine import ReconciliationEngine
+from src.models.statement_index import StatementIndex
+from src.deployment.jobs import JobManager, QueueFull
+from src.deployment.result_cache import ResultCache
+from src.deployment.warmup import Warmup, default_steps
+from src.observability.profiler import sample_stacks, to_collapsed
+from src.observability.tracing import end_trace, start_trace
 
 
 class SpeakerProfile(BaseModel):
@@ -32,7 +41,68 @@ class ReconciliationRequest(BaseModel):
     tensions: List[str]
 
 
-app = FastAPI(title="websim.ai Discourse Analysis API")
+class SimilarityRequest(BaseModel):
+    text: str
+    k: int = Field(default=10, ge=1, le=100)
+    n_probe: int = Field(default=8, ge=1)
+
+
+class JobRequest(BaseModel):
+    kind: str
+    params: Dict[str, Any] = Field(default_factory=dict)
+    priority: int = 0
+
+
+job_manager = JobManager.from_env()
+warmup = Warmup(default_steps(os.getenv("WARMUP_MODEL", "all-MiniLM-L6-v2")))
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    if os.getenv("WARMUP_ENABLED", "1") != "0":
+        warmup.start()
+    job_manager.recover()
+    yield
+    job_manager.shutdown(wait=False)
+
+
+app = FastAPI(title="websim.ai Discourse Analysis API", lifespan=lifespan)
+
+
+result_cache = ResultCache.from_env()
+CACHE_VERSION = os.getenv("RESULT_CACHE_VERSION", "1")
+
+
+def _file_version(path: str | None) -> List[object] | None:
+    if not path or not os.path.exists(path):
+        return None
+    stat = os.stat(path)
+    return [path, stat.st_mtime_ns, stat.st_size]
+
+
+_statement_indexes: Dict[str, tuple[List[object], StatementIndex]] = {}
+
+
+def _statement_index(path: str) -> StatementIndex:
+    """One open index per path, reopened when its metadata or centroids change."""
+    version = [_file_version(os.path.join(path, name)) for name in ("metadata.jsonl", "centroids.npy")]
+    cached = _statement_indexes.get(path)
+    if cached is None or cached[0] != version:
+        cached = (version, StatementIndex(path))
+        _statement_indexes[path] = cached
+    return cached[1]
+
+
+@app.middleware("http")
+async def server_timing(request: Request, call_next) -> Response:
+    """Collect spans for the request and summarise them in a Server-Timing header."""
+    trace, token = start_trace()
+    try:
+        response = await call_next(request)
+    finally:
+        end_trace(token)
+    response.headers["Server-Timing"] = trace.server_timing()
+    return response
 
 
 @app.get("/health")
@@ -41,6 +111,13 @@ async def health() -> Dict[str, str]:
     return {"status": "ok"}
 
 
+@app.get("/ready")
+async def ready() -> JSONResponse:
+    """Readiness probe reporting background warm-up of heavy dependencies."""
+    report = warmup.report()
+    return JSONResponse(report, status_code=200 if report["ready"] else 503)
+
+
 @app.post("/analyze/ideology", response_model=IdeologyResponse)
 async def map_ideology(profile: SpeakerProfile) -> IdeologyResponse:
     mapper = IdeologyMapper()
@@ -49,7 +126,12 @@ async def map_ideology(profile: SpeakerProfile) -> IdeologyResponse:
         mapper.load_axes(axes_path)
     if not mapper.axes:
         raise HTTPException(status_code=500, detail="No ideology axes configured.")
-    positions = mapper.map_speaker(profile.quotes)
+    positions = result_cache.get_or_compute(
+        "ideology",
+        profile.quotes,
+        lambda: mapper.map_speaker(profile.quotes),
+        version=[CACHE_VERSION, mapper.model_name, _file_version(axes_path)],
+    )
     return IdeologyResponse(speaker=profile.name, positions=positions)
 
 
@@ -60,8 +142,12 @@ async def detect_tension(payload: Dict[str, str]) -> Dict[str, object]:
     if not speaker_a or not speaker_b:
         raise HTTPException(status_code=400, detail="Both speaker_a and speaker_b text required.")
     detector = TensionDetector()
-    result = detector.analyze_exchange(speaker_a, speaker_b)
-    return result.__dict__
+    return result_cache.get_or_compute(
+        "tension",
+        [speaker_a, speaker_b],
+        lambda: detector.analyze_exchange(speaker_a, speaker_b).to_dict(),
+        version=[CACHE_VERSION, detector.tension_keywords, detector.concession_phrases],
+    )
 
 
 @app.post("/audience/pressure")
@@ -71,8 +157,12 @@ async def audience_pressure(payload: Dict[str, List[str]]) -> Dict[str, object]:
     if not host_statements or not audience_comments:
         raise HTTPException(status_code=400, detail="host_statements and audience_comments required.")
     analyzer = AudiencePressureAnalyzer()
-    report = analyzer.measure_divergence(host_statements, audience_comments)
-    return report.__dict__
+    return result_cache.get_or_compute(
+        "audience",
+        [host_statements, audience_comments],
+        lambda: analyzer.measure_divergence(host_statements, audience_comments).to_dict(),
+        version=[CACHE_VERSION, analyzer.model_name],
+    )
 
 
 @app.post("/reconciliation/generate")
@@ -91,15 +181,88 @@ async def generate_reconciliation(request: ReconciliationRequest) -> Dict[str, o
 
 
 @app.get("/overton/track/{topic}")
-async def track_overton(topic: str) -> Dict[str, object]:
+async def track_overton(
+    topic: str,
+    freq: str | None = Query(default=None, description="Resample bucket: 'daily' or 'weekly'."),
+    window: int | None = Query(default=None, ge=1, description="Rolling window in buckets."),
+    max_points: int | None = Query(default=None, ge=3, description="LTTB point cap per trace."),
+) -> Dict[str, object]:
+    from src.analysis.overton_shift import OvertonTracker
+
     tracker = OvertonTracker()
     storage_path = os.getenv("OVERTON_DATA_PATH")
     if storage_path and os.path.exists(storage_path):
         tracker.load(storage_path)
     if not tracker.timeline:
         raise HTTPException(status_code=404, detail="No Overton timeline data available.")
-    figure = tracker.plot_shift(topic)
+    try:
+        figure = tracker.plot_shift(topic, freq=freq, window=window, max_points=max_points)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     return {"topic": topic, "figure": figure.to_json()}
 
 
+@app.post("/search/similar")
+async def search_similar(request: SimilarityRequest) -> Dict[str, object]:
+    index_path = os.getenv("STATEMENT_INDEX_PATH")
+    if not index_path or not os.path.exists(index_path):
+        raise HTTPException(status_code=404, detail="No statement index available.")
+    index = _statement_index(index_path)
+    hits = index.search(request.text, k=request.k, n_probe=request.n_probe)
+    return {"query": request.text, "results": [hit.to_dict() for hit in hits]}
+
+
+@app.post("/jobs", status_code=202)
+async def submit_job(request: JobRequest) -> Dict[str, object]:
+    try:
+        job_id = job_manager.submit(request.kind, request.params, priority=request.priority)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except QueueFull as exc:
+        raise HTTPException(status_code=429, detail=str(exc)) from exc
+    return job_manager.status(job_id)
+
+
+@app.get("/jobs/{job_id}")
+async def job_status(job_id: str) -> Dict[str, object]:
+    try:
+        return job_manager.status(job_id)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail=f"Unknown job {job_id}.") from exc
+
+
+@app.get("/jobs/{job_id}/result")
+async def job_result(job_id: str) -> Dict[str, object]:
+    try:
+        return {"id": job_id, "result": job_manager.result(job_id)}
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail=f"Unknown job {job_id}.") from exc
+    except LookupError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+
+
+@app.delete("/jobs/{job_id}")
+async def cancel_job(job_id: str) -> Dict[str, object]:
+    try:
+        return job_manager.cancel(job_id)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail=f"Unknown job {job_id}.") from exc
+
+
+@app.get("/admin/profile", response_class=PlainTextResponse)
+async def profile(
+    seconds: float = Query(default=5.0, gt=0, le=60),
+    interval_ms: float = Query(default=5.0, ge=1, le=1000),
+    x_admin_token: str | None = Header(default=None),
+) -> PlainTextResponse:
+    """Sample this worker's stacks for ``seconds`` and return collapsed flamegraph input."""
+    admin_token = os.getenv("ADMIN_TOKEN")
+    if not admin_token:
+        raise HTTPException(status_code=403, detail="Profiling is disabled; set ADMIN_TOKEN to enable it.")
+    if not x_admin_token or not hmac.compare_digest(x_admin_token, admin_token):
+        raise HTTPException(status_code=403, detail="Invalid admin token.")
+    counts = await asyncio.to_thread(sample_stacks, seconds, interval_ms / 1000)
+    return PlainTextResponse(to_collapsed(counts))
+
+
 __all__ = ["app"]
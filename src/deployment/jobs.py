@@ -0,0 +1,398 @@
+"""Background job queue for long-running analysis work."""
+
+from __future__ import annotations
+
+import heapq
+import importlib
+import itertools
+import json
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import BrokenExecutor, Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+
+JOB_HANDLERS: Dict[str, str] = {
+    "train_axes": "src.deployment.jobs:train_axes_job",
+    "analyze_transcript": "src.deployment.jobs:analyze_transcript_job",
+    "reconcile_pairs": "src.deployment.jobs:reconcile_pairs_job",
+}
+
+JOB_PATH_PARAMS: Dict[str, tuple[str, ...]] = {
+    "train_axes": ("data_path", "output_path"),
+    "analyze_transcript": ("input_path",),
+}
+
+TERMINAL_STATES = {"succeeded", "failed", "cancelled"}
+
+
+class JobCancelled(Exception):
+    """Raised inside a worker when its job has been cancelled."""
+
+
+class QueueFull(Exception):
+    """Raised when the bounded job queue cannot accept more work."""
+
+
+def resolve_data_path(value: str | os.PathLike, jobs_dir: str | Path | None = None) -> Path:
+    """Resolve a client-supplied path under ``JOB_DATA_DIR``, rejecting anything outside it.
+
+    Paths inside ``jobs_dir`` are rejected too, so a job cannot overwrite
+    another job's record or result.
+    """
+    root = Path(os.getenv("JOB_DATA_DIR", "data")).resolve()
+    path = (root / str(value)).resolve()
+    if not path.is_relative_to(root):
+        raise ValueError(f"Path '{value}' is outside the job data directory.")
+    if jobs_dir is not None and path.is_relative_to(Path(jobs_dir).resolve()):
+        raise ValueError(f"Path '{value}' points into the job state directory.")
+    return path
+
+
+def _pid_alive(pid: Any) -> bool:
+    if not isinstance(pid, int) or pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _write_json(path: Path, payload: Mapping[str, Any]) -> None:
+    tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+    tmp_path.write_text(json.dumps(payload))
+    os.replace(tmp_path, path)
+
+
+class JobContext:
+    """Handed to job handlers for progress reporting and cooperative cancellation."""
+
+    def __init__(self, jobs_dir: str | Path, job_id: str) -> None:
+        self.jobs_dir = Path(jobs_dir)
+        self.job_id = job_id
+
+    @property
+    def cancelled(self) -> bool:
+        return (self.jobs_dir / f"{self.job_id}.cancel").exists()
+
+    def report(self, progress: float, message: str = "") -> None:
+        if self.cancelled:
+            raise JobCancelled(self.job_id)
+        _write_json(
+            self.jobs_dir / f"{self.job_id}.progress",
+            {"progress": max(0.0, min(1.0, float(progress))), "message": message},
+        )
+
+
+def _run_job(kind: str, params: Mapping[str, Any], jobs_dir: str, job_id: str) -> None:
+    module_name, func_name = JOB_HANDLERS[kind].split(":")
+    handler = getattr(importlib.import_module(module_name), func_name)
+    context = JobContext(jobs_dir, job_id)
+    context.report(0.0, "started")
+    result = handler(params, context)
+    _write_json(Path(jobs_dir) / f"{job_id}.result", {"result": result})
+    context.report(1.0, "finished")
+
+
+class JobManager:
+    """Priority queue in front of a process pool, with job state persisted to disk.
+
+    Job records live in ``jobs_dir`` as ``<id>.json`` alongside the worker's
+    ``<id>.progress`` and ``<id>.result`` files, so any API worker can answer
+    status and result queries. Higher ``priority`` values run first.
+    """
+
+    def __init__(
+        self,
+        jobs_dir: str | Path,
+        max_workers: int | None = None,
+        max_queue: int = 64,
+        executor_factory: Callable[[int], Any] | None = None,
+    ) -> None:
+        self.jobs_dir = Path(jobs_dir)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_queue = max_queue
+        self._executor_factory = executor_factory or (
+            lambda workers: ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        )
+        self._executor: Any = None
+        self._queue: List[tuple[int, int, str]] = []
+        self._sequence = itertools.count()
+        self._running: Dict[str, Future] = {}
+        self._condition = threading.Condition()
+        self._records_lock = threading.Lock()
+        self._dispatcher: Optional[threading.Thread] = None
+        self._closed = False
+
+    @classmethod
+    def from_env(cls) -> "JobManager":
+        workers = os.getenv("JOB_WORKERS")
+        return cls(
+            os.getenv("JOBS_DIR", "data/jobs"),
+            max_workers=int(workers) if workers else None,
+            max_queue=int(os.getenv("JOB_QUEUE_SIZE", "64")),
+        )
+
+    def _record_path(self, job_id: str) -> Path:
+        return self.jobs_dir / f"{job_id}.json"
+
+    def _load_record(self, job_id: str) -> Dict[str, Any]:
+        path = self._record_path(job_id)
+        if not path.exists():
+            raise KeyError(job_id)
+        return json.loads(path.read_text())
+
+    def _update_record(self, job_id: str, only_active: bool = False, **changes: Any) -> None:
+        """Read-modify-write a record under the records lock.
+
+        With ``only_active`` the update is dropped once the job has reached a
+        terminal status, so a late cancel cannot resurrect a finished job.
+        """
+        with self._records_lock:
+            record = self._load_record(job_id)
+            if only_active and record["status"] in TERMINAL_STATES:
+                return
+            record.update(changes)
+            _write_json(self._record_path(job_id), record)
+
+    def submit(self, kind: str, params: Mapping[str, Any], priority: int = 0) -> str:
+        if kind not in JOB_HANDLERS:
+            raise ValueError(f"Unknown job kind '{kind}'; expected one of {sorted(JOB_HANDLERS)}.")
+        for name in JOB_PATH_PARAMS.get(kind, ()):
+            if name in params:
+                resolve_data_path(params[name], self.jobs_dir)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Job manager has been shut down.")
+            if len(self._queue) >= self.max_queue:
+                raise QueueFull(f"Job queue is full ({self.max_queue} pending jobs).")
+            job_id = uuid.uuid4().hex
+            self.jobs_dir.mkdir(parents=True, exist_ok=True)
+            _write_json(
+                self._record_path(job_id),
+                {
+                    "id": job_id,
+                    "kind": kind,
+                    "params": dict(params),
+                    "priority": priority,
+                    "owner": os.getpid(),
+                    "status": "queued",
+                    "submitted_at": time.time(),
+                    "started_at": None,
+                    "finished_at": None,
+                    "error": None,
+                },
+            )
+            heapq.heappush(self._queue, (-priority, next(self._sequence), job_id))
+            self._ensure_dispatcher()
+            self._condition.notify_all()
+        return job_id
+
+    def recover(self) -> List[str]:
+        """Adopt jobs orphaned by a previous process that is no longer alive.
+
+        Queued jobs are re-enqueued here; jobs that were running are marked
+        failed, since their partial work cannot be resumed. Returns the ids of
+        re-enqueued jobs.
+        """
+        if not self.jobs_dir.exists():
+            return []
+        requeued = []
+        for path in sorted(self.jobs_dir.glob("*.json")):
+            record = json.loads(path.read_text())
+            if record["status"] in TERMINAL_STATES or _pid_alive(record.get("owner")):
+                continue
+            if record["status"] == "running":
+                self._update_record(
+                    record["id"], status="failed", error="Interrupted by a server restart.", finished_at=time.time()
+                )
+                continue
+            self._update_record(record["id"], owner=os.getpid())
+            with self._condition:
+                heapq.heappush(self._queue, (-record["priority"], next(self._sequence), record["id"]))
+                self._ensure_dispatcher()
+                self._condition.notify_all()
+            requeued.append(record["id"])
+        return requeued
+
+    def status(self, job_id: str) -> Dict[str, Any]:
+        record = self._load_record(job_id)
+        progress_path = self.jobs_dir / f"{job_id}.progress"
+        progress = json.loads(progress_path.read_text()) if progress_path.exists() else {}
+        record["progress"] = progress.get("progress", 0.0)
+        record["message"] = progress.get("message", "")
+        return record
+
+    def result(self, job_id: str) -> Any:
+        record = self._load_record(job_id)
+        if record["status"] != "succeeded":
+            raise LookupError(f"Job {job_id} is {record['status']}; no result available.")
+        return json.loads((self.jobs_dir / f"{job_id}.result").read_text())["result"]
+
+    def cancel(self, job_id: str) -> Dict[str, Any]:
+        record = self._load_record(job_id)
+        if record["status"] in TERMINAL_STATES:
+            return self.status(job_id)
+        (self.jobs_dir / f"{job_id}.cancel").touch()
+        with self._condition:
+            queued = [entry for entry in self._queue if entry[2] == job_id]
+            if queued:
+                self._queue.remove(queued[0])
+                heapq.heapify(self._queue)
+            future = self._running.get(job_id)
+        if queued:
+            self._update_record(job_id, status="cancelled", finished_at=time.time())
+        elif future is None or not future.cancel():
+            self._update_record(job_id, only_active=True, cancel_requested=True)
+        return self.status(job_id)
+
+    def _ensure_dispatcher(self) -> None:
+        if self._dispatcher is None or not self._dispatcher.is_alive():
+            self._dispatcher = threading.Thread(target=self._dispatch, name="job-dispatcher", daemon=True)
+            self._dispatcher.start()
+
+    def _dispatch(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed and (
+                    not self._queue or len(self._running) >= self.max_workers
+                ):
+                    self._condition.wait()
+                if self._closed:
+                    return
+                _, _, job_id = heapq.heappop(self._queue)
+                if (self.jobs_dir / f"{job_id}.cancel").exists():
+                    self._update_record(job_id, status="cancelled", finished_at=time.time())
+                    continue
+                if self._executor is None:
+                    self._executor = self._executor_factory(self.max_workers)
+                record = self._load_record(job_id)
+                try:
+                    future = self._executor.submit(
+                        _run_job, record["kind"], record["params"], str(self.jobs_dir), job_id
+                    )
+                except Exception as exc:  # e.g. BrokenProcessPool after a worker was killed
+                    self._update_record(
+                        job_id, status="failed", error=f"{type(exc).__name__}: {exc}", finished_at=time.time()
+                    )
+                    self._discard_executor()
+                    continue
+                self._update_record(job_id, status="running", started_at=time.time())
+                self._running[job_id] = future
+            future.add_done_callback(lambda done, job_id=job_id: self._finish(job_id, done))
+
+    def _discard_executor(self) -> None:
+        """Drop a broken pool so the next dispatch starts a fresh one."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _finish(self, job_id: str, future: Future) -> None:
+        if future.cancelled():
+            status, error = "cancelled", None
+        elif isinstance(future.exception(), JobCancelled):
+            status, error = "cancelled", None
+        elif future.exception() is not None:
+            status, error = "failed", f"{type(future.exception()).__name__}: {future.exception()}"
+        else:
+            status, error = "succeeded", None
+        try:
+            self._update_record(job_id, status=status, error=error, finished_at=time.time())
+        finally:
+            with self._condition:
+                self._running.pop(job_id, None)
+                if not future.cancelled() and isinstance(future.exception(), BrokenExecutor):
+                    self._discard_executor()
+                self._condition.notify_all()
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            executor = self._executor
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def train_axes_job(params: Mapping[str, Any], context: JobContext) -> Dict[str, Any]:
+    from src.models.ideology_mapper import train_from_spec
+
+    data_path = resolve_data_path(params["data_path"], context.jobs_dir)
+    output_path = resolve_data_path(params["output_path"], context.jobs_dir)
+    context.report(0.1, "training axes")
+    train_from_spec(
+        data_path,
+        output_path,
+        params.get("model_name", "all-MiniLM-L6-v2"),
+        progress=lambda done, total: context.report(0.1 + 0.9 * done / total, f"trained axis {done}/{total}"),
+    )
+    return {"output_path": str(output_path)}
+
+
+def analyze_transcript_job(params: Mapping[str, Any], context: JobContext) -> Dict[str, Any]:
+    """Normalize a transcript, then extract entities, claims and tense exchanges."""
+    from src.ingestion.entity_extractor import extract_entities
+    from src.ingestion.fact_checker import collect_claims
+    from src.ingestion.transcript_parser import parse_transcript_columns
+    from src.models.tension_detector import TensionDetector
+
+    raw = params.get("transcript") or json.loads(resolve_data_path(params["input_path"], context.jobs_dir).read_text())
+    transcript = parse_transcript_columns(raw)
+    context.report(0.1, "extracting entities and claims")
+    entities = extract_entities(transcript)
+    claims = collect_claims(transcript)
+
+    speakers, timestamps, texts = transcript.speakers, transcript.timestamp_values(), transcript.texts
+    detector = TensionDetector()
+    threshold = float(params.get("tension_threshold", 0.5))
+    exchanges = []
+    for position in range(len(transcript) - 1):
+        if position % 100 == 0:
+            context.report(0.2 + 0.8 * position / max(len(transcript) - 1, 1), "scoring exchanges")
+        if speakers[position] == speakers[position + 1]:
+            continue
+        analysis = detector.analyze_exchange(texts[position], texts[position + 1])
+        if analysis.tension_score >= threshold:
+            exchanges.append({"timestamp": timestamps[position + 1], **analysis.to_dict()})
+    return {"entities": entities, "claims": claims, "tense_exchanges": exchanges}
+
+
+def reconcile_pairs_job(params: Mapping[str, Any], context: JobContext) -> List[Dict[str, Any]]:
+    from src.models.reconciliation_engine import ReconciliationEngine
+
+    api_key = os.getenv("ANTHROPIC_API_KEY")
+    if not api_key:
+        raise RuntimeError("ANTHROPIC_API_KEY environment variable is required.")
+    engine = ReconciliationEngine(api_key=api_key)
+    pairs = list(params["pairs"])
+    frameworks = []
+    for position, pair in enumerate(pairs):
+        context.report(position / len(pairs), f"reconciling pair {position + 1}/{len(pairs)}")
+        frameworks.append(
+            engine.generate_framework(
+                speaker_a=pair["speaker_a"],
+                speaker_b=pair["speaker_b"],
+                shared_goals=pair.get("shared_goals", []),
+                key_tensions=pair.get("tensions", []),
+            )
+        )
+    return frameworks
+
+
+__all__ = [
+    "JOB_HANDLERS",
+    "JobCancelled",
+    "JobContext",
+    "JobManager",
+    "QueueFull",
+    "resolve_data_path",
+]
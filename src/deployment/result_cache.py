@@ -0,0 +1,142 @@
+"""Shared response cache for the analysis endpoints."""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Protocol, Tuple
+
+from src.observability.tracing import span
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 3600
+
+
+class CacheBackend(Protocol):
+    def get(self, key: str) -> Optional[bytes]: ...
+
+    def set(self, key: str, value: bytes, ttl: int) -> None: ...
+
+
+class InMemoryBackend:
+    """Thread-safe bounded LRU with per-entry expiry."""
+
+    def __init__(self, max_entries: int = 1024, clock: Callable[[], float] = time.monotonic) -> None:
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self.clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        with self._lock:
+            self._entries[key] = (self.clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class RedisBackend:
+    def __init__(self, url: str) -> None:
+        redis = importlib.import_module("redis")
+        self.client = redis.Redis.from_url(url, socket_timeout=0.5, socket_connect_timeout=0.5)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(key)
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        self.client.set(key, value, ex=ttl)
+
+
+def _json_default(value: Any) -> Any:
+    if hasattr(value, "item"):  # numpy scalars
+        return value.item()
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dumps(value: Any) -> bytes:
+    return json.dumps(
+        value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=_json_default
+    ).encode()
+
+
+class ResultCache:
+    """TTL cache keyed by a canonical hash of the payload plus a model/config version.
+
+    Values are stored as zlib-compressed compact JSON. Redis (``REDIS_URL``)
+    shares entries across uvicorn workers; otherwise an in-process LRU is used.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: int = DEFAULT_TTL_SECONDS, prefix: str = "websim") -> None:
+        self.backend = backend
+        self.ttl = ttl
+        self.prefix = prefix
+
+    @classmethod
+    def from_env(cls) -> "ResultCache":
+        ttl = int(os.getenv("RESULT_CACHE_TTL", DEFAULT_TTL_SECONDS))
+        redis_url = os.getenv("REDIS_URL")
+        if redis_url and importlib.util.find_spec("redis") is not None:
+            try:
+                backend = RedisBackend(redis_url)
+                backend.client.ping()
+                return cls(backend, ttl=ttl)
+            except Exception as exc:  # pragma: no cover - depends on deployment
+                logger.warning("Redis unavailable at %s (%s); using in-process cache.", redis_url, exc)
+        return cls(InMemoryBackend(), ttl=ttl)
+
+    def key(self, namespace: str, payload: Any, version: Any = None) -> str:
+        digest = hashlib.sha256(_dumps({"payload": payload, "version": version})).hexdigest()
+        return f"{self.prefix}:{namespace}:{digest}"
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            raw = self.backend.get(key)
+            return None if raw is None else json.loads(zlib.decompress(raw))
+        except Exception as exc:
+            logger.warning("Result cache read failed: %s", exc)
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        try:
+            self.backend.set(key, zlib.compress(_dumps(value)), self.ttl)
+        except Exception as exc:
+            logger.warning("Result cache write failed: %s", exc)
+
+    def get_or_compute(
+        self, namespace: str, payload: Any, compute: Callable[[], Any], version: Any = None
+    ) -> Any:
+        key = self.key(namespace, payload, version)
+        with span("cache.get"):
+            cached = self.get(key)
+        if cached is not None:
+            return cached
+        value = json.loads(_dumps(compute()))
+        with span("cache.set"):
+            self.set(key, value)
+        return value
+
+
+__all__ = ["CacheBackend", "InMemoryBackend", "RedisBackend", "ResultCache"]
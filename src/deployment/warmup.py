@@ -0,0 +1,82 @@
+"""Background warm-up of heavy dependencies for readiness probes."""
+
+from __future__ import annotations
+
+import importlib
+import threading
+import time
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from src.models.encoders import load_sentence_encoder
+
+
+WarmupStep = Tuple[str, Callable[[], object]]
+
+
+def _import(module_name: str) -> Callable[[], object]:
+    return lambda: importlib.import_module(module_name)
+
+
+def default_steps(model_name: str | None = "all-MiniLM-L6-v2") -> List[WarmupStep]:
+    steps: List[WarmupStep] = [
+        ("overton_shift", _import("src.analysis.overton_shift")),
+        ("anthropic", _import("anthropic")),
+        ("sentence_transformers", _import("sentence_transformers")),
+    ]
+    if model_name:
+        steps.append((f"encoder:{model_name}", lambda: load_sentence_encoder(model_name)))
+    return steps
+
+
+class Warmup:
+    """Run warm-up steps once on a daemon thread and expose their progress.
+
+    A step that fails (for example an optional package that is not installed)
+    is reported as ``failed`` but does not block readiness; the endpoints that
+    need it raise the underlying error on first use instead.
+    """
+
+    def __init__(self, steps: Sequence[WarmupStep]) -> None:
+        self.steps = list(steps)
+        self._state: Dict[str, Dict[str, object]] = {
+            name: {"status": "pending", "seconds": None, "error": None} for name, _ in self.steps
+        }
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="warmup", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        for name, step in self.steps:
+            with self._lock:
+                self._state[name]["status"] = "running"
+            started = time.perf_counter()
+            try:
+                step()
+                status, error = "done", None
+            except Exception as exc:
+                status, error = "failed", f"{type(exc).__name__}: {exc}"
+            with self._lock:
+                self._state[name].update(
+                    status=status, seconds=time.perf_counter() - started, error=error
+                )
+
+    def report(self) -> Dict[str, object]:
+        with self._lock:
+            steps = {name: dict(state) for name, state in self._state.items()}
+            started = self._thread is not None
+        finished = sum(state["status"] in {"done", "failed"} for state in steps.values())
+        ready = started and finished == len(steps)
+        return {
+            "status": "ready" if ready else "warming" if started else "not_started",
+            "ready": ready,
+            "progress": finished / len(steps) if steps else 1.0,
+            "steps": steps,
+        }
+
+
+__all__ = ["Warmup", "default_steps"]
@@ -7,16 +7,17 @@ import json
 import re
 from collections import Counter
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict, Mapping
+
+from src.ingestion.transcript_parser import TranscriptColumns, iter_texts
 
 
 ENTITY_PATTERN = re.compile(r"\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b")
 
 
-def extract_entities(transcript: Dict[str, object]) -> Dict[str, int]:
+def extract_entities(transcript: TranscriptColumns | Mapping[str, Any]) -> Dict[str, int]:
     counter: Counter[str] = Counter()
-    for segment in transcript.get("segments", []):
-        text = segment.get("text", "")
+    for text in iter_texts(transcript):
         for match in ENTITY_PATTERN.findall(text):
             counter[match] += 1
     return dict(counter)
@@ -4,23 +4,44 @@ from __future__ import annotations
 
 import argparse
 import json
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List
-
-
-def collect_claims(transcript: Dict[str, object]) -> List[Dict[str, str]]:
-    claims: List[Dict[str, str]] = []
-    for segment in transcript.get("segments", []):
-        text = segment.get("text", "")
-        if any(trigger in text.lower() for trigger in ("according to", "reports", "study")):
-            claims.append(
-                {
-                    "speaker": segment.get("speaker", "unknown"),
-                    "timestamp": segment.get("timestamp", 0.0),
-                    "claim": text,
-                }
-            )
-    return claims
+from typing import Any, Dict, List, Mapping
+
+from src.ingestion.transcript_parser import TranscriptColumns, iter_segments
+
+
+CLAIM_TRIGGERS = ("according to", "reports", "study")
+
+
+@dataclass(slots=True)
+class Claim:
+    speaker: str
+    timestamp: float
+    claim: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"speaker": self.speaker, "timestamp": self.timestamp, "claim": self.claim}
+
+
+def _is_claim(text: str) -> bool:
+    lower = text.lower()
+    for trigger in CLAIM_TRIGGERS:
+        if trigger in lower:
+            return True
+    return False
+
+
+def collect_claim_records(transcript: TranscriptColumns | Mapping[str, Any]) -> List[Claim]:
+    return [
+        Claim(speaker, timestamp, text)
+        for speaker, timestamp, text in iter_segments(transcript)
+        if _is_claim(text)
+    ]
+
+
+def collect_claims(transcript: TranscriptColumns | Mapping[str, Any]) -> List[Dict[str, Any]]:
+    return [claim.to_dict() for claim in collect_claim_records(transcript)]
 
 
 def main() -> None:
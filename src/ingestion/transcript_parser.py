@@ -4,8 +4,95 @@ from __future__ import annotations
 
 import argparse
 import json
+import math
+import sys
+from array import array
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple
+
+Segment = Tuple[str, Any, str]
+
+
+@dataclass(slots=True)
+class TranscriptColumns:
+    """Normalized segments stored column-wise instead of as one dict per segment.
+
+    Speaker names are interned so repeated speakers share one string, and
+    timestamps live in a packed ``array('d')``. Only real ``float`` values are
+    stored there alone; ints are packed as floats and also kept in
+    ``raw_timestamps`` by position, while anything else (``"15"``, ``True``,
+    ``None``) is stored as NaN and kept verbatim there. :meth:`to_dict`
+    therefore reproduces :func:`parse_transcript` exactly; use it to get the
+    ``{"segments": [...]}`` shape at API and file boundaries.
+    """
+
+    speakers: List[Any] = field(default_factory=list)
+    timestamps: array = field(default_factory=lambda: array("d"))
+    texts: List[str] = field(default_factory=list)
+    raw_timestamps: Dict[int, Any] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __iter__(self) -> Iterator[Segment]:
+        return zip(self.speakers, self.timestamp_values(), self.texts)
+
+    def timestamp_values(self) -> Sequence[Any]:
+        """Timestamps with non-numeric inputs restored to their original values."""
+        if not self.raw_timestamps:
+            return self.timestamps
+        values: List[Any] = self.timestamps.tolist()
+        for position, raw in self.raw_timestamps.items():
+            values[position] = raw
+        return values
+
+    def append(self, speaker: Any, timestamp: Any, text: str) -> None:
+        kind = type(timestamp)
+        if kind is float:
+            value = timestamp
+        else:
+            self.raw_timestamps[len(self.timestamps)] = timestamp
+            value = float(timestamp) if kind is int else math.nan
+        self.speakers.append(sys.intern(speaker) if type(speaker) is str else speaker)
+        self.timestamps.append(value)
+        self.texts.append(text)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "segments": [
+                {"speaker": speaker, "timestamp": timestamp, "text": text}
+                for speaker, timestamp, text in self
+            ]
+        }
+
+
+def parse_transcript_columns(raw_data: Mapping[str, Any]) -> TranscriptColumns:
+    columns = TranscriptColumns()
+    append = columns.append
+    for entry in raw_data.get("segments", []):
+        append(
+            entry.get("speaker", "unknown"),
+            entry.get("timestamp", 0.0),
+            entry.get("text", ""),
+        )
+    return columns
+
+
+def iter_segments(transcript: TranscriptColumns | Mapping[str, Any]) -> Iterator[Segment]:
+    """Yield ``(speaker, timestamp, text)`` from columns or a ``{"segments": [...]}`` mapping."""
+    if isinstance(transcript, TranscriptColumns):
+        return iter(transcript)
+    return (
+        (segment.get("speaker", "unknown"), segment.get("timestamp", 0.0), segment.get("text", ""))
+        for segment in transcript.get("segments", [])
+    )
+
+
+def iter_texts(transcript: TranscriptColumns | Mapping[str, Any]) -> Iterable[str]:
+    if isinstance(transcript, TranscriptColumns):
+        return transcript.texts
+    return (segment.get("text", "") for segment in transcript.get("segments", []))
 
 
 def parse_transcript(raw_data: Dict[str, Any]) -> Dict[str, Any]:
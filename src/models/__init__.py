@@ -1,12 +1,29 @@
+from typing import Any
+
 from .ideology_mapper import IdeologyMapper, IdeologyAxis
 from .tension_detector import TensionDetector, TensionAnalysis
 from .reconciliation_engine import ReconciliationEngine, SpeakerProfile
+from .speaker_aggregates import SpeakerAggregateStore
+from .statement_index import StatementHit, StatementIndex
 
 __all__ = [
     "IdeologyMapper",
     "IdeologyAxis",
     "TensionDetector",
     "TensionAnalysis",
+    "LexicalPrescreen",
     "ReconciliationEngine",
     "SpeakerProfile",
+    "SpeakerAggregateStore",
+    "StatementHit",
+    "StatementIndex",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # LexicalPrescreen pulls in scipy, so it is only imported when requested.
+    if name == "LexicalPrescreen":
+        from .lexical_prescreen import LexicalPrescreen
+
+        return LexicalPrescreen
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
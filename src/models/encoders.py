@@ -0,0 +1,30 @@
+"""Process-wide cache of sentence-transformer encoders, loaded on first use."""
+
+from __future__ import annotations
+
+import importlib
+import threading
+from typing import TYPE_CHECKING, Dict
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from sentence_transformers import SentenceTransformer
+
+
+_ENCODERS: Dict[str, "SentenceTransformer"] = {}
+_LOCK = threading.Lock()
+
+
+def load_sentence_encoder(model_name: str, required_by: str = "sentence encoding") -> "SentenceTransformer":
+    """Return the shared encoder for ``model_name``, importing and loading it once."""
+    with _LOCK:
+        encoder = _ENCODERS.get(model_name)
+        if encoder is None:
+            if importlib.util.find_spec("sentence_transformers") is None:
+                raise ImportError(f"The 'sentence_transformers' package is required for {required_by}.")
+            sentence_transformers = importlib.import_module("sentence_transformers")
+            encoder = sentence_transformers.SentenceTransformer(model_name)
+            _ENCODERS[model_name] = encoder
+        return encoder
+
+
+__all__ = ["load_sentence_encoder"]
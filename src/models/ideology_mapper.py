@@ -3,23 +3,25 @@
 from __future__ import annotations
 
 import argparse
-import importlib
 import json
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, List, Mapping, MutableMapping
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Mapping, MutableMapping
 
 import numpy as np
 
-if importlib.util.find_spec("sentence_transformers") is None:  # pragma: no cover - informative failure
-    raise ImportError(
-        "The 'sentence_transformers' package is required for IdeologyMapper."
-    )
+from src.observability.tracing import span
 
-from sentence_transformers import SentenceTransformer  # noqa: E402  (import after validation)
+from .encoders import load_sentence_encoder
+from .speaker_aggregates import SpeakerAggregateStore, Timestamp
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from sentence_transformers import SentenceTransformer
 
-@dataclass
+    from .lexical_prescreen import LexicalPrescreen
+
+
+@dataclass(slots=True)
 class IdeologyAxis:
     """Represents a single ideological dimension."""
 
@@ -53,11 +55,14 @@ class IdeologyMapper:
     model_name: str = "all-MiniLM-L6-v2"
     _encoder: SentenceTransformer | None = field(default=None, init=False, repr=False)
     axes: MutableMapping[str, IdeologyAxis] = field(default_factory=dict)
+    aggregates: SpeakerAggregateStore = field(default_factory=SpeakerAggregateStore)
+    prescreen: LexicalPrescreen | None = None
 
     @property
     def encoder(self) -> SentenceTransformer:
         if self._encoder is None:
-            self._encoder = SentenceTransformer(self.model_name)
+            with span("ideology.load_encoder"):
+                self._encoder = load_sentence_encoder(self.model_name, required_by="IdeologyMapper")
         return self._encoder
 
     def add_axis(
@@ -98,17 +103,106 @@ class IdeologyMapper:
             json.dumps([axis.to_dict() for axis in self.axes.values()], indent=2)
         )
 
-    def map_speaker(self, quotes: Iterable[str]) -> Dict[str, float]:
+    def _axis_matrix(self) -> np.ndarray:
+        """Axis vectors stacked column-wise (embedding dim × axes)."""
+        return np.stack([axis.vector for axis in self.axes.values()], axis=1)
+
+    def _project(self, embedding: np.ndarray) -> Dict[str, float]:
+        if not self.axes:
+            return {}
+        with span("ideology.project"):
+            return dict(zip(self.axes, (embedding @ self._axis_matrix()).tolist()))
+
+    def map_speaker(
+        self, quotes: Iterable[str], two_tier: bool = False, approximate_weight: float = 0.5
+    ) -> Dict[str, float]:
+        """Project the mean embedding of ``quotes`` onto every axis.
+
+        With ``two_tier`` only quotes flagged by the lexical pre-screen are
+        encoded; the rest contribute their approximate projections with
+        ``approximate_weight``.
+        """
         statements = list(quotes)
         if not statements:
             raise ValueError("At least one quote is required to map a speaker.")
+        if two_tier:
+            if approximate_weight <= 0:
+                raise ValueError("approximate_weight must be positive for two-tier mapping.")
+            return self._map_two_tier(statements, approximate_weight)
+
+        encoder = self.encoder
+        with span("ideology.encode"):
+            embedding = encoder.encode(statements).mean(axis=0)
+        return self._project(embedding)
+
+    def fit_prescreen(
+        self, texts: Iterable[str], alpha: float = 1.0, threshold_quantile: float = 0.5
+    ) -> LexicalPrescreen:
+        """Distil the current axes into a hashed n-gram pre-screen using ``texts``."""
+        from .lexical_prescreen import LexicalPrescreen  # scipy is only needed for two-tier mode
+
+        calibration = list(texts)
+        if not calibration or not self.axes:
+            raise ValueError("Fitting a pre-screen requires axes and at least one calibration text.")
+        projections = self.encoder.encode(calibration) @ self._axis_matrix()
+        self.prescreen = LexicalPrescreen(axis_names=list(self.axes)).fit(
+            calibration, projections, alpha=alpha, threshold_quantile=threshold_quantile
+        )
+        return self.prescreen
+
+    def _map_two_tier(self, statements: List[str], approximate_weight: float) -> Dict[str, float]:
+        if self.prescreen is None or self.prescreen.axis_names != list(self.axes):
+            raise ValueError("Two-tier mapping requires a pre-screen fitted on the current axes.")
+        with span("ideology.prescreen"):
+            flagged, approximate = self.prescreen.flag(statements)
+        total = approximate_weight * approximate[~flagged].sum(axis=0)
+        weight = approximate_weight * float((~flagged).sum())
+        if flagged.any():
+            encoder = self.encoder
+            with span("ideology.encode"):
+                embeddings = encoder.encode([s for s, keep in zip(statements, flagged) if keep])
+            with span("ideology.project"):
+                total = total + (embeddings @ self._axis_matrix()).sum(axis=0)
+            weight += float(flagged.sum())
+        return {name: float(value) for name, value in zip(self.axes, total / weight)}
+
+    def record_quotes(
+        self, speaker: str, quotes: Iterable[str], timestamps: Iterable[Timestamp]
+    ) -> None:
+        """Encode new quotes once and fold them into the speaker's aggregates."""
+        statements = list(quotes)
+        if not statements:
+            return
+        self.aggregates.add(speaker, self.encoder.encode(statements), timestamps)
 
-        embedding = self.encoder.encode(statements).mean(axis=0)
-        results: Dict[str, float] = {}
-        for axis in self.axes.values():
-            projection = float(np.dot(embedding, axis.vector))
-            results[axis.name] = projection
-        return results
+    def map_speaker_history(
+        self,
+        speaker: str,
+        start: Timestamp | None = None,
+        end: Timestamp | None = None,
+    ) -> Dict[str, float]:
+        """Project a recorded speaker's mean embedding over bucket-aligned ``[start, end)``."""
+        return self._project(self.aggregates.mean_embedding(speaker, start, end))
+
+    def compare_speaker_histories(
+        self,
+        speaker_a: str,
+        speaker_b: str,
+        start: Timestamp | None = None,
+        end: Timestamp | None = None,
+    ) -> Dict[str, float]:
+        a_map = self.map_speaker_history(speaker_a, start, end)
+        b_map = self.map_speaker_history(speaker_b, start, end)
+        return {
+            axis: abs(a_map[axis] - b_map[axis]) for axis in self.axes.keys()
+        }
+
+    def ideology_drift(self, speaker: str) -> List[Dict[str, object]]:
+        """Per-bucket axis positions for a recorded speaker, oldest first."""
+        return [
+            {"start": bucket, "count": count, "positions": self._project(embedding)}
+            for bucket, count, embedding in self.aggregates.bucket_means(speaker)
+        ]
 
     def compare_speakers(
         self, speaker_a_quotes: Iterable[str], speaker_b_quotes: Iterable[str]
@@ -120,19 +214,31 @@ class IdeologyMapper:
         }
 
 
-def train_from_spec(data_path: str | Path, output_path: str | Path, model_name: str) -> None:
+def train_from_spec(
+    data_path: str | Path,
+    output_path: str | Path,
+    model_name: str,
+    progress: Callable[[int, int], None] | None = None,
+) -> None:
+    """Train every axis in the spec and save them.
+
+    ``progress(done, total)`` is called after each axis; raising from it
+    aborts training before anything is written.
+    """
     spec = json.loads(Path(data_path).read_text())
     axes_spec = spec.get("axes", [])
     if not axes_spec:
         raise ValueError("Training specification must contain at least one axis definition under 'axes'.")
 
     mapper = IdeologyMapper(model_name=model_name)
-    for axis in axes_spec:
+    for done, axis in enumerate(axes_spec, start=1):
         mapper.add_axis(
             axis["name"],
             axis["positive_examples"],
             axis["negative_examples"],
         )
+        if progress is not None:
+            progress(done, len(axes_spec))
     mapper.save_axes(output_path)
 
 
@@ -0,0 +1,181 @@
+"""Cheap hashed n-gram pre-screen distilled from ideology axis projections."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import time
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Sequence
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import lsqr
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from src.models.ideology_mapper import IdeologyMapper
+
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9']+")
+
+
+@dataclass
+class HashedNgramVectorizer:
+    """L2-normalised unigram+bigram counts hashed into ``n_features`` buckets."""
+
+    n_features: int = 2**14
+
+    def transform(self, texts: Sequence[str]) -> sparse.csr_matrix:
+        rows: List[int] = []
+        cols: List[int] = []
+        for row, text in enumerate(texts):
+            tokens = TOKEN_PATTERN.findall(text.lower())
+            grams = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+            rows.extend([row] * len(grams))
+            cols.extend(zlib.crc32(gram.encode()) % self.n_features for gram in grams)
+        matrix = sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, cols)), shape=(len(texts), self.n_features)
+        )
+        matrix.sum_duplicates()
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        norms[norms == 0.0] = 1.0
+        return sparse.diags(1.0 / norms) @ matrix
+
+
+@dataclass
+class LexicalPrescreen:
+    """Ridge model predicting per-quote axis projections from hashed n-grams.
+
+    Because projections are linear in the embedding, predicting them directly
+    is equivalent to predicting an approximate embedding and projecting it.
+    A quote is flagged as carrying ideological signal when its predicted
+    projections deviate from the calibration mean by more than ``threshold``.
+    """
+
+    axis_names: List[str]
+    vectorizer: HashedNgramVectorizer = field(default_factory=HashedNgramVectorizer)
+    weights: np.ndarray | None = field(default=None, repr=False)
+    intercept: np.ndarray | None = field(default=None, repr=False)
+    threshold: float = 0.0
+
+    def fit(
+        self,
+        texts: Sequence[str],
+        projections: np.ndarray,
+        alpha: float = 1.0,
+        threshold_quantile: float = 0.5,
+    ) -> "LexicalPrescreen":
+        """Distil ``projections`` (texts × axes) and set the threshold at a quantile.
+
+        Each axis is a sparse ridge problem solved with LSQR, so memory stays
+        linear in the number of calibration texts. ``threshold_quantile`` is
+        the share of calibration texts that would be left to the approximate tier.
+        """
+        features = self.vectorizer.transform(texts)
+        projections = np.asarray(projections, dtype=float)
+        self.intercept = projections.mean(axis=0)
+        targets = projections - self.intercept
+        damp = float(np.sqrt(alpha))
+        self.weights = np.column_stack(
+            [
+                lsqr(features, targets[:, axis], damp=damp, atol=1e-10, btol=1e-10)[0]
+                for axis in range(targets.shape[1])
+            ]
+        )
+        self.threshold = float(np.quantile(self.signal(texts), threshold_quantile))
+        return self
+
+    def predict(self, texts: Sequence[str]) -> np.ndarray:
+        if self.weights is None:
+            raise ValueError("LexicalPrescreen must be fitted before use.")
+        return np.asarray(self.vectorizer.transform(texts) @ self.weights) + self.intercept
+
+    def signal(self, texts: Sequence[str]) -> np.ndarray:
+        return np.linalg.norm(self.predict(texts) - self.intercept, axis=1)
+
+    def flag(self, texts: Sequence[str]) -> tuple[np.ndarray, np.ndarray]:
+        """Return ``(flagged mask, approximate projections)`` for ``texts``."""
+        predicted = self.predict(texts)
+        flagged = np.linalg.norm(predicted - self.intercept, axis=1) > self.threshold
+        return flagged, predicted
+
+
+def evaluate_two_tier(mapper: IdeologyMapper, quotes: Sequence[str], repeat: int = 3) -> Dict[str, object]:
+    """Compare ``map_speaker`` full vs two-tier on ``quotes``: error, speed, encoded share."""
+    mapper.map_speaker(quotes[:1])  # load the encoder outside the timed runs
+
+    def best(two_tier: bool) -> tuple[float, Dict[str, float]]:
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            positions = mapper.map_speaker(quotes, two_tier=two_tier)
+            timings.append(time.perf_counter() - started)
+        return min(timings), positions
+
+    full_seconds, full = best(False)
+    tiered_seconds, tiered = best(True)
+    flagged, _ = mapper.prescreen.flag(quotes)
+    errors = {axis: abs(full[axis] - tiered[axis]) for axis in full}
+    return {
+        "quotes": len(quotes),
+        "encoded_fraction": float(flagged.mean()),
+        "full_seconds": full_seconds,
+        "two_tier_seconds": tiered_seconds,
+        "speedup": full_seconds / tiered_seconds if tiered_seconds else float("inf"),
+        "abs_error": errors,
+        "full_positions": full,
+        "two_tier_positions": tiered,
+    }
+
+
+def _quotes(path: Path) -> List[str]:
+    payload = json.loads(path.read_text())
+    if isinstance(payload, dict):
+        return [segment["text"] for segment in payload.get("segments", []) if segment.get("text")]
+    return [str(quote) for quote in payload]
+
+
+def main() -> None:  # pragma: no cover - CLI glue
+    from src.models.ideology_mapper import IdeologyMapper
+
+    parser = argparse.ArgumentParser(description="Report the two-tier ideology mapping tradeoff")
+    parser.add_argument("--spec", default="configs/ideology_axes_training.json")
+    parser.add_argument("--axes", default=None, help="Trained axes JSON; trains from --spec if omitted")
+    parser.add_argument("--quotes", nargs="+", default=["data/raw/transcript_full.json"])
+    parser.add_argument(
+        "--calibration", nargs="*", default=[], help="Extra distillation texts, kept apart from --quotes"
+    )
+    parser.add_argument("--threshold-quantile", type=float, default=0.5)
+    parser.add_argument("--model-name", default="all-MiniLM-L6-v2")
+    args = parser.parse_args()
+
+    mapper = IdeologyMapper(model_name=args.model_name)
+    spec = json.loads(Path(args.spec).read_text())["axes"]
+    if args.axes:
+        mapper.load_axes(args.axes)
+    else:
+        for axis in spec:
+            mapper.add_axis(axis["name"], axis["positive_examples"], axis["negative_examples"])
+
+    quotes: List[str] = []
+    for path in args.quotes:
+        quotes.extend(_quotes(Path(path)))
+    calibration = [text for path in args.calibration for text in _quotes(Path(path))]
+    calibration += [text for axis in spec for text in axis["positive_examples"] + axis["negative_examples"]]
+    mapper.fit_prescreen(calibration, threshold_quantile=args.threshold_quantile)
+    # Report only on quotes the pre-screen has not been fitted on.
+    seen = set(calibration)
+    held_out = [quote for quote in quotes if quote not in seen]
+    if not held_out:
+        parser.error("Every quote is also a calibration text; nothing is held out for evaluation.")
+    print(json.dumps(evaluate_two_tier(mapper, held_out), indent=2))
+
+
+__all__ = ["HashedNgramVectorizer", "LexicalPrescreen", "evaluate_two_tier"]
+
+
+if __name__ == "__main__":
+    main()
@@ -7,11 +7,7 @@ import json
 from dataclasses import dataclass
 from typing import Dict, Iterable, List, Mapping
 
-
-if importlib.util.find_spec("anthropic") is None:  # pragma: no cover - explicit error
-    raise ImportError("The 'anthropic' package is required for ReconciliationEngine.")
-
-from anthropic import Anthropic
+from src.observability.tracing import span
 
 
 @dataclass
@@ -33,7 +29,10 @@ class SpeakerProfile:
 
 class ReconciliationEngine:
     def __init__(self, api_key: str, model: str = "claude-3-sonnet-20240229") -> None:
-        self.client = Anthropic(api_key=api_key)
+        if importlib.util.find_spec("anthropic") is None:
+            raise ImportError("The 'anthropic' package is required for ReconciliationEngine.")
+        anthropic = importlib.import_module("anthropic")
+        self.client = anthropic.Anthropic(api_key=api_key)
         self.model = model
 
     def generate_framework(
@@ -55,14 +54,17 @@ class ReconciliationEngine:
             else SpeakerProfile.from_mapping(speaker_b)
         )
 
-        prompt = self._build_prompt(profile_a, profile_b, shared_goals, key_tensions)
-        message = self.client.messages.create(
-            model=self.model,
-            max_tokens=max_tokens,
-            messages=[{"role": "user", "content": prompt}],
-        )
-        content = message.content[0].text
-        return json.loads(content)
+        with span("reconciliation.prompt"):
+            prompt = self._build_prompt(profile_a, profile_b, shared_goals, key_tensions)
+        with span("reconciliation.llm"):
+            message = self.client.messages.create(
+                model=self.model,
+                max_tokens=max_tokens,
+                messages=[{"role": "user", "content": prompt}],
+            )
+        with span("reconciliation.parse"):
+            content = message.content[0].text
+            return json.loads(content)
 
     def _build_prompt(
         self,
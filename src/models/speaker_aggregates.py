@@ -0,0 +1,151 @@
+"""Persistent per-speaker embedding aggregates bucketed over time."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, List, MutableMapping, Tuple
+
+import numpy as np
+
+
+Timestamp = float | datetime
+
+
+def _epoch(value: Timestamp) -> float:
+    """Epoch seconds; naive datetimes are read as UTC so buckets align to UTC days."""
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    return float(value)
+
+
+@dataclass
+class SpeakerAggregate:
+    """Running embedding sums for one speaker, total and per time bucket."""
+
+    total: np.ndarray
+    count: int = 0
+    buckets: MutableMapping[int, Tuple[np.ndarray, int]] = field(default_factory=dict)
+
+    def add(self, bucket: int, embeddings: np.ndarray) -> None:
+        partial = embeddings.sum(axis=0)
+        self.total = self.total + partial
+        self.count += len(embeddings)
+        bucket_sum, bucket_count = self.buckets.get(bucket, (np.zeros_like(partial), 0))
+        self.buckets[bucket] = (bucket_sum + partial, bucket_count + len(embeddings))
+
+    def window(self, start: int | None, end: int | None) -> Tuple[np.ndarray, int]:
+        if start is None and end is None:
+            return self.total, self.count
+        total = np.zeros_like(self.total)
+        count = 0
+        for bucket, (bucket_sum, bucket_count) in self.buckets.items():
+            if (start is None or bucket >= start) and (end is None or bucket < end):
+                total = total + bucket_sum
+                count += bucket_count
+        return total, count
+
+
+@dataclass
+class SpeakerAggregateStore:
+    """Fold each quote's embedding in once and answer mean-embedding queries.
+
+    Buckets are ``bucket_seconds`` wide (one day by default) and keyed by the
+    bucket's start in epoch seconds, so any range aligned to the bucket size
+    is answered exactly from partial sums.
+    """
+
+    bucket_seconds: int = 86_400
+    speakers: MutableMapping[str, SpeakerAggregate] = field(default_factory=dict)
+
+    def bucket_of(self, timestamp: Timestamp) -> int:
+        return int(_epoch(timestamp) // self.bucket_seconds) * self.bucket_seconds
+
+    def add(self, speaker: str, embeddings: np.ndarray, timestamps: Iterable[Timestamp]) -> None:
+        embeddings = np.atleast_2d(np.asarray(embeddings, dtype=float))
+        buckets = np.array([self.bucket_of(ts) for ts in timestamps], dtype=np.int64)
+        if len(buckets) != len(embeddings):
+            raise ValueError("Each embedding requires exactly one timestamp.")
+        aggregate = self.speakers.get(speaker)
+        if aggregate is None:
+            aggregate = SpeakerAggregate(total=np.zeros(embeddings.shape[1]))
+            self.speakers[speaker] = aggregate
+        for bucket in np.unique(buckets):
+            aggregate.add(int(bucket), embeddings[buckets == bucket])
+
+    def _boundary(self, value: Timestamp | None) -> int | None:
+        if value is None:
+            return None
+        bucket = self.bucket_of(value)
+        if bucket != _epoch(value):
+            raise ValueError(
+                f"Range boundary {value!r} is not aligned to the {self.bucket_seconds}s bucket size."
+            )
+        return bucket
+
+    def mean_embedding(
+        self,
+        speaker: str,
+        start: Timestamp | None = None,
+        end: Timestamp | None = None,
+    ) -> np.ndarray:
+        """Mean embedding over ``[start, end)``; both bounds must fall on bucket starts."""
+        if speaker not in self.speakers:
+            raise KeyError(f"No aggregates recorded for speaker '{speaker}'.")
+        total, count = self.speakers[speaker].window(self._boundary(start), self._boundary(end))
+        if not count:
+            raise ValueError(f"Speaker '{speaker}' has no quotes in the requested range.")
+        return total / count
+
+    def bucket_means(self, speaker: str) -> List[Tuple[int, int, np.ndarray]]:
+        """Return ``(bucket_start, count, mean_embedding)`` in chronological order."""
+        if speaker not in self.speakers:
+            raise KeyError(f"No aggregates recorded for speaker '{speaker}'.")
+        buckets = self.speakers[speaker].buckets
+        return [
+            (bucket, count, bucket_sum / count)
+            for bucket, (bucket_sum, count) in sorted(buckets.items())
+        ]
+
+    def save(self, path: str | Path) -> None:
+        names: List[str] = []
+        buckets: List[int] = []
+        counts: List[int] = []
+        sums: List[np.ndarray] = []
+        for name, aggregate in self.speakers.items():
+            for bucket, (bucket_sum, count) in aggregate.buckets.items():
+                names.append(name)
+                buckets.append(bucket)
+                counts.append(count)
+                sums.append(bucket_sum)
+        with Path(path).open("wb") as handle:
+            np.savez_compressed(
+                handle,
+                bucket_seconds=np.int64(self.bucket_seconds),
+                speakers=np.array(names, dtype=str),
+                buckets=np.array(buckets, dtype=np.int64),
+                counts=np.array(counts, dtype=np.int64),
+                sums=np.array(sums, dtype=float),
+            )
+
+    @classmethod
+    def load(cls, path: str | Path) -> "SpeakerAggregateStore":
+        with np.load(path) as payload:
+            store = cls(bucket_seconds=int(payload["bucket_seconds"]))
+            sums = payload["sums"]
+            for name, bucket, count, bucket_sum in zip(
+                payload["speakers"], payload["buckets"], payload["counts"], sums
+            ):
+                aggregate = store.speakers.setdefault(
+                    str(name), SpeakerAggregate(total=np.zeros(sums.shape[1]))
+                )
+                aggregate.buckets[int(bucket)] = (bucket_sum, int(count))
+                aggregate.total = aggregate.total + bucket_sum
+                aggregate.count += int(count)
+        return store
+
+
+__all__ = ["SpeakerAggregate", "SpeakerAggregateStore"]
@@ -0,0 +1,328 @@
+"""Persistent approximate-nearest-neighbour index over statement embeddings."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Sequence
+
+import numpy as np
+
+from .encoders import load_sentence_encoder
+
+
+@dataclass(slots=True)
+class StatementHit:
+    score: float
+    statement_id: int
+    speaker: str
+    timestamp: Any  # seconds, or the raw value when the source was not numeric
+    transcript: str
+    text: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "score": self.score,
+            "statement_id": self.statement_id,
+            "speaker": self.speaker,
+            "timestamp": self.timestamp,
+            "transcript": self.transcript,
+            "text": self.text,
+        }
+
+
+def _timestamp(value: Any) -> Any:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return value
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if vectors.ndim == 1:
+        vectors = vectors[None, :]
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    return vectors / norms
+
+
+def _spherical_kmeans(
+    vectors: np.ndarray, n_lists: int, iterations: int = 20, seed: int = 0
+) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centroids = vectors[rng.choice(len(vectors), size=n_lists, replace=False)].copy()
+    for _ in range(iterations):
+        assignments = np.argmax(vectors @ centroids.T, axis=1)
+        for list_id in range(n_lists):
+            members = vectors[assignments == list_id]
+            if len(members):
+                centroids[list_id] = members.sum(axis=0)
+            else:
+                centroids[list_id] = vectors[rng.integers(len(vectors))]
+        centroids = _normalize(centroids)
+    return centroids
+
+
+@dataclass
+class StatementIndex:
+    """Inverted-file (IVF) cosine index with memory-mapped vector storage.
+
+    Vectors are appended to ``vectors.f32`` as raw float32 rows, their
+    inverted-list ids to ``lists.i32`` and their speaker/timestamp/transcript
+    metadata to ``metadata.jsonl``. Until :meth:`train` is called searches fall
+    back to brute force; afterwards every insert is routed to its nearest
+    centroid so the index can grow without retraining.
+    """
+
+    path: Path
+    model_name: str = "all-MiniLM-L6-v2"
+    encoder: Any = field(default=None, repr=False)
+    dim: int | None = field(default=None, init=False)
+    centroids: np.ndarray | None = field(default=None, init=False, repr=False)
+    metadata: List[Dict[str, Any]] = field(default_factory=list, init=False, repr=False)
+    _vectors: np.ndarray | None = field(default=None, init=False, repr=False)
+    _lists: np.ndarray | None = field(default=None, init=False, repr=False)
+    _inverted: tuple[np.ndarray, np.ndarray] | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.path = Path(self.path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        config_path = self.path / "index.json"
+        if config_path.exists():
+            config = json.loads(config_path.read_text())
+            self.dim = config["dim"]
+            self.model_name = config.get("model_name", self.model_name)
+        centroids_path = self.path / "centroids.npy"
+        if centroids_path.exists():
+            self.centroids = np.load(centroids_path)
+        metadata_path = self.path / "metadata.jsonl"
+        if metadata_path.exists():
+            self.metadata = self._read_metadata(metadata_path)
+        self._truncate_to_metadata()
+
+    @staticmethod
+    def _read_metadata(path: Path) -> List[Dict[str, Any]]:
+        """Parse ``metadata.jsonl``, cutting off a partial last line left by a crash."""
+        raw = path.read_bytes()
+        complete = raw[: raw.rfind(b"\n") + 1]
+        if len(complete) != len(raw):
+            with path.open("r+b") as handle:
+                handle.truncate(len(complete))
+        return [json.loads(line) for line in complete.decode().splitlines() if line.strip()]
+
+    def _truncate_to_metadata(self) -> None:
+        # Metadata is appended last, so rows beyond it belong to an interrupted insert.
+        for name, row_bytes in (("vectors.f32", 4 * (self.dim or 0)), ("lists.i32", 4)):
+            path = self.path / name
+            if path.exists() and path.stat().st_size > len(self.metadata) * row_bytes:
+                os.truncate(path, len(self.metadata) * row_bytes)
+
+    def __len__(self) -> int:
+        return len(self.metadata)
+
+    def _encoder(self) -> Any:
+        if self.encoder is None:
+            self.encoder = load_sentence_encoder(self.model_name, required_by="StatementIndex")
+        return self.encoder
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        return _normalize(self._encoder().encode(list(texts)))
+
+    @property
+    def vectors(self) -> np.ndarray:
+        if self._vectors is None:
+            self._vectors = self._open("vectors.f32", np.float32, (len(self), self.dim or 0))
+        return self._vectors
+
+    @property
+    def lists(self) -> np.ndarray:
+        if self._lists is None:
+            self._lists = self._open("lists.i32", np.int32, (len(self),))
+        return self._lists
+
+    def _open(self, name: str, dtype: type, shape: tuple[int, ...]) -> np.ndarray:
+        if not len(self):
+            return np.empty(shape, dtype=dtype)
+        return np.memmap(self.path / name, dtype=dtype, mode="r", shape=shape)
+
+    def _invalidate(self) -> None:
+        self._vectors = None
+        self._lists = None
+        self._inverted = None
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        if self.centroids is None:
+            return np.full(len(vectors), -1, dtype=np.int32)
+        return np.argmax(vectors @ self.centroids.T, axis=1).astype(np.int32)
+
+    def add_vectors(self, vectors: np.ndarray, metadata: Sequence[Mapping[str, Any]]) -> List[int]:
+        vectors = _normalize(vectors)
+        if len(vectors) != len(metadata):
+            raise ValueError("Each vector requires exactly one metadata record.")
+        if self.dim is None:
+            self.dim = int(vectors.shape[1])
+            (self.path / "index.json").write_text(
+                json.dumps({"dim": self.dim, "model_name": self.model_name})
+            )
+        elif vectors.shape[1] != self.dim:
+            raise ValueError(f"Expected {self.dim}-dimensional vectors, got {vectors.shape[1]}.")
+
+        start = len(self)
+        records = [
+            {
+                "speaker": str(record.get("speaker", "unknown")),
+                "timestamp": _timestamp(record.get("timestamp", 0.0)),
+                "transcript": str(record.get("transcript", "")),
+                "text": str(record.get("text", "")),
+            }
+            for record in metadata
+        ]
+        self._invalidate()
+        with (self.path / "vectors.f32").open("ab") as handle:
+            handle.write(vectors.tobytes())
+        with (self.path / "lists.i32").open("ab") as handle:
+            handle.write(self._assign(vectors).tobytes())
+        with (self.path / "metadata.jsonl").open("a") as handle:
+            for record in records:
+                handle.write(json.dumps(record) + "\n")
+        self.metadata.extend(records)
+        return list(range(start, start + len(records)))
+
+    def add_statements(self, statements: Sequence[Mapping[str, Any]]) -> List[int]:
+        """Encode and insert records carrying ``text`` plus optional metadata."""
+        if not statements:
+            return []
+        return self.add_vectors(self.encode([record["text"] for record in statements]), statements)
+
+    def add_transcript(self, transcript: Mapping[str, Any], transcript_id: str) -> List[int]:
+        segments = [
+            {**segment, "transcript": transcript_id}
+            for segment in transcript.get("segments", [])
+            if segment.get("text")
+        ]
+        return self.add_statements(segments)
+
+    def train(self, n_lists: int | None = None, sample_size: int = 50_000, seed: int = 0) -> None:
+        """Cluster stored vectors into ``n_lists`` inverted lists (default ~sqrt(N))."""
+        if not len(self):
+            raise ValueError("Cannot train an empty statement index.")
+        n_lists = n_lists or max(1, int(np.sqrt(len(self))))
+        n_lists = min(n_lists, len(self))
+        rng = np.random.default_rng(seed)
+        sample_ids = np.sort(rng.choice(len(self), size=min(sample_size, len(self)), replace=False))
+        self.centroids = _spherical_kmeans(np.asarray(self.vectors[sample_ids]), n_lists, seed=seed)
+        np.save(self.path / "centroids.npy", self.centroids)
+
+        assignments = np.concatenate(
+            [
+                self._assign(np.asarray(self.vectors[offset : offset + 65_536]))
+                for offset in range(0, len(self), 65_536)
+            ]
+        )
+        self._invalidate()
+        assignments.tofile(self.path / "lists.i32")
+
+    def _inverted_lists(self) -> tuple[np.ndarray, np.ndarray]:
+        if self._inverted is None:
+            order = np.argsort(self.lists, kind="stable")
+            bounds = np.searchsorted(
+                self.lists[order], np.arange(len(self.centroids) + 1), side="left"
+            )
+            self._inverted = (order, bounds)
+        return self._inverted
+
+    def _candidates(self, query: np.ndarray, n_probe: int) -> np.ndarray:
+        if self.centroids is None or n_probe >= len(self.centroids):
+            return np.arange(len(self))
+        order, bounds = self._inverted_lists()
+        probes = np.argsort(-(self.centroids @ query))[:n_probe]
+        return np.sort(np.concatenate([order[bounds[p] : bounds[p + 1]] for p in probes]))
+
+    def search_vector(self, query: np.ndarray, k: int = 10, n_probe: int = 8) -> List[StatementHit]:
+        if not len(self):
+            return []
+        query = _normalize(query)[0]
+        candidates = self._candidates(query, n_probe)
+        if not len(candidates):
+            return []
+        scores = np.asarray(self.vectors[candidates]) @ query
+        top = np.argsort(-scores)[:k]
+        return [
+            StatementHit(score=float(scores[i]), statement_id=int(candidates[i]), **self.metadata[candidates[i]])
+            for i in top
+        ]
+
+    def search(self, text: str, k: int = 10, n_probe: int = 8) -> List[StatementHit]:
+        return self.search_vector(self.encode([text]), k=k, n_probe=n_probe)
+
+
+def benchmark_recall(
+    index: StatementIndex,
+    n_queries: int = 100,
+    k: int = 10,
+    probes: Iterable[int] = (1, 2, 4, 8, 16, 32),
+    seed: int = 0,
+) -> List[Dict[str, float]]:
+    """Measure recall@k and mean latency of IVF search against brute force.
+
+    Queries are stored vectors perturbed with small noise so no encoder is needed.
+    """
+    if index.centroids is None:
+        raise ValueError("Train the index before benchmarking approximate search.")
+    rng = np.random.default_rng(seed)
+    query_ids = rng.choice(len(index), size=min(n_queries, len(index)), replace=False)
+    queries = np.asarray(index.vectors[query_ids])
+    queries = _normalize(queries + rng.normal(scale=0.05, size=queries.shape).astype(np.float32))
+
+    started = time.perf_counter()
+    exact = [
+        {hit.statement_id for hit in index.search_vector(query, k=k, n_probe=len(index.centroids))}
+        for query in queries
+    ]
+    brute_force_ms = (time.perf_counter() - started) * 1000 / len(queries)
+
+    results = [{"n_probe": float(len(index.centroids)), "recall": 1.0, "latency_ms": brute_force_ms}]
+    for n_probe in probes:
+        if n_probe >= len(index.centroids):
+            continue
+        started = time.perf_counter()
+        approximate = [
+            {hit.statement_id for hit in index.search_vector(query, k=k, n_probe=n_probe)}
+            for query in queries
+        ]
+        latency_ms = (time.perf_counter() - started) * 1000 / len(queries)
+        recall = float(
+            np.mean([len(a & e) / max(len(e), 1) for a, e in zip(approximate, exact)])
+        )
+        results.append({"n_probe": float(n_probe), "recall": recall, "latency_ms": latency_ms})
+    return sorted(results, key=lambda row: row["n_probe"])
+
+
+def main() -> None:  # pragma: no cover - CLI glue
+    parser = argparse.ArgumentParser(description="Build or benchmark the statement similarity index")
+    parser.add_argument("--index", required=True)
+    parser.add_argument("--input", nargs="*", default=[], help="Normalized transcript JSON files to add")
+    parser.add_argument("--train", action="store_true")
+    parser.add_argument("--lists", type=int, default=None)
+    parser.add_argument("--benchmark", action="store_true")
+    parser.add_argument("--model-name", default="all-MiniLM-L6-v2")
+    args = parser.parse_args()
+
+    index = StatementIndex(args.index, model_name=args.model_name)
+    for input_path in args.input:
+        index.add_transcript(json.loads(Path(input_path).read_text()), Path(input_path).stem)
+    if args.train:
+        index.train(args.lists)
+    if args.benchmark:
+        print(json.dumps(benchmark_recall(index), indent=2))
+
+
+__all__ = ["StatementHit", "StatementIndex", "benchmark_recall"]
+
+
+if __name__ == "__main__":
+    main()
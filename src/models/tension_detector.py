@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import importlib
 from dataclasses import dataclass
-from typing import Dict, Iterable, List
+from typing import Any, Dict, Iterable, List
 
+from src.observability.tracing import span
 
-@dataclass
+
+@dataclass(slots=True)
 class TensionAnalysis:
     tension_score: float
     reconcilable: bool
@@ -16,6 +18,16 @@ class TensionAnalysis:
     triggers: List[str]
     de_escalations: List[str]
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "tension_score": self.tension_score,
+            "reconcilable": self.reconcilable,
+            "attack_score": self.attack_score,
+            "concession_score": self.concession_score,
+            "triggers": self.triggers,
+            "de_escalations": self.de_escalations,
+        }
+
 
 class TensionDetector:
     """Flag tense conversational exchanges using lightweight heuristics."""
@@ -71,10 +83,12 @@ class TensionDetector:
         return score, phrases
 
     def analyze_exchange(self, speaker_a_text: str, speaker_b_text: str) -> TensionAnalysis:
-        attack_score, triggers = self._score_attacks(speaker_a_text, speaker_b_text)
-        concession_score, concessions = self._score_concessions(
-            speaker_a_text, speaker_b_text
-        )
+        with span("tension.attack_keywords"):
+            attack_score, triggers = self._score_attacks(speaker_a_text, speaker_b_text)
+        with span("tension.concession_keywords"):
+            concession_score, concessions = self._score_concessions(
+                speaker_a_text, speaker_b_text
+            )
 
         tension = max(0.0, min(1.0, attack_score - concession_score))
         reconcilable = tension < 0.6 and concession_score > 0
@@ -0,0 +1,44 @@
+"""On-demand sampling profiler producing collapsed (flamegraph) stacks."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+from typing import Dict, List, Optional
+
+
+def _frame_stack(frame: Optional[FrameType]) -> List[str]:
+    stack = []
+    while frame is not None:
+        code = frame.f_code
+        stack.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+        frame = frame.f_back
+    stack.reverse()
+    return stack
+
+
+def sample_stacks(seconds: float, interval: float = 0.005) -> Counter:
+    """Sample every other thread's Python stack for ``seconds`` and count each stack."""
+    own_id = threading.get_ident()
+    names: Dict[int, str] = {thread.ident: thread.name for thread in threading.enumerate()}
+    counts: Counter = Counter()
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_id:
+                continue
+            thread_name = names.get(thread_id, f"thread-{thread_id}")
+            counts[";".join([thread_name, *_frame_stack(frame)])] += 1
+        time.sleep(interval)
+    return counts
+
+
+def to_collapsed(counts: Counter) -> str:
+    """Render counts in Brendan Gregg's folded format (flamegraph.pl, speedscope)."""
+    return "".join(f"{stack} {count}\n" for stack, count in counts.most_common())
+
+
+__all__ = ["sample_stacks", "to_collapsed"]
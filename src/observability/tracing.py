@@ -0,0 +1,89 @@
+"""Lightweight per-request span tracing summarised as a Server-Timing header."""
+
+from __future__ import annotations
+
+import functools
+import time
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+
+class Trace:
+    """Spans recorded while handling one request, in completion order."""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.spans: List[Tuple[str, float]] = []
+
+    def record(self, name: str, seconds: float) -> None:
+        self.spans.append((name, seconds))
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        totals: Dict[str, Dict[str, float]] = {}
+        for name, seconds in self.spans:
+            entry = totals.setdefault(name, {"ms": 0.0, "count": 0})
+            entry["ms"] += seconds * 1000
+            entry["count"] += 1
+        return totals
+
+    def server_timing(self) -> str:
+        metrics = [
+            f'{name};dur={entry["ms"]:.2f};desc="x{entry["count"]}"'
+            for name, entry in self.summary().items()
+        ]
+        metrics.append(f"total;dur={(time.perf_counter() - self.started) * 1000:.2f}")
+        return ", ".join(metrics)
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_CURRENT: ContextVar[Optional[Trace]] = ContextVar("current_trace", default=None)
+
+
+def start_trace() -> Tuple[Trace, Token]:
+    trace = Trace()
+    return trace, _CURRENT.set(trace)
+
+
+def end_trace(token: Token) -> None:
+    _CURRENT.reset(token)
+
+
+def current_trace() -> Optional[Trace]:
+    return _CURRENT.get()
+
+
+class span:
+    """Time a block into the active trace; a no-op when no trace is active."""
+
+    __slots__ = ("name", "trace", "started")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.trace = _CURRENT.get()
+
+    def __enter__(self) -> "span":
+        if self.trace is not None:
+            self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self.trace is not None:
+            self.trace.record(self.name, time.perf_counter() - self.started)
+
+
+def traced(name: str) -> Callable[[F], F]:
+    """Decorator form of :class:`span` covering a whole function call."""
+
+    def decorate(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+__all__ = ["Trace", "current_trace", "end_trace", "span", "start_trace", "traced"]
@@ -0,0 +1,46 @@
+import json
+import subprocess
+import sys
+import time
+
+from fastapi.testclient import TestClient
+
+from src.deployment import api_server
+from src.deployment.warmup import Warmup
+
+HEAVY_MODULES = ["anthropic", "pandas", "plotly", "scipy", "sentence_transformers", "torch"]
+
+IMPORT_PROBE = f"""
+import json, sys, time
+started = time.perf_counter()
+import backend.nexus.api
+elapsed = time.perf_counter() - started
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in {HEAVY_MODULES!r} if m in sys.modules]}}))
+"""
+
+
+def test_api_import_is_fast_and_defers_heavy_dependencies():
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_PROBE], capture_output=True, text=True, check=True
+    ).stdout
+    probe = json.loads(output.strip().splitlines()[-1])
+    print(f"backend.nexus.api import: {probe['seconds']:.3f}s")
+    assert probe["loaded"] == []
+    assert probe["seconds"] < 5.0
+
+
+def test_ready_reports_warmup_progress(monkeypatch):
+    warmup = Warmup([("quick", lambda: None), ("broken", lambda: 1 / 0)])
+    monkeypatch.setattr(api_server, "warmup", warmup)
+    client = TestClient(api_server.app)
+    assert client.get("/ready").status_code == 503
+
+    warmup.start()
+    deadline = time.time() + 5
+    while not warmup.report()["ready"]:
+        assert time.time() < deadline
+        time.sleep(0.01)
+    response = client.get("/ready")
+    assert response.status_code == 200
+    assert response.json()["steps"]["broken"]["status"] == "failed"
+    assert client.get("/health").json() == {"status": "ok"}
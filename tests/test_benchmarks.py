@@ -0,0 +1,26 @@
+import pytest
+
+from benchmarks.run import CASE_MAX_SCALE, CASES, find_regressions, run_benchmarks
+from benchmarks.synthetic import StubEncoder, generate_transcript
+
+
+def test_synthetic_data_and_stub_encoder_are_deterministic():
+    assert generate_transcript(20, seed=3) == generate_transcript(20, seed=3)
+    encoder = StubEncoder(dim=8)
+    assert (encoder.encode(["Thanks for having me."]) == encoder.encode(["Thanks for having me."])).all()
+
+
+def test_benchmark_suite_runs_every_case_and_flags_regressions():
+    report = run_benchmarks(scale=50, repeat=1)
+    assert set(report["results"]) == set(CASES)
+    baseline = {"50": {name: result["best_seconds"] / 10 for name, result in report["results"].items()}}
+    assert len(find_regressions(report, baseline, threshold=0.25)) == len(CASES)
+    with pytest.raises(LookupError, match="scale 50"):
+        find_regressions(report, {"10000": {}}, threshold=0.25)
+
+
+def test_memory_heavy_cases_are_capped(monkeypatch):
+    monkeypatch.setitem(CASE_MAX_SCALE, "ingestion.parse_transcript", 20)
+    report = run_benchmarks(scale=50, repeat=1, cases=["ingestion.parse_transcript"])
+    assert report["results"]["ingestion.parse_transcript"]["scale"] == 20
+    assert report["results"]["ingestion.parse_transcript_columns"]["scale"] == 50
@@ -0,0 +1,58 @@
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+DECO_SIM_PATH = Path(__file__).resolve().parents[1] / "qutip-shader-deco-fusion" / "qutip" / "deco_sim.py"
+
+
+@pytest.fixture(scope="module")
+def deco_sim():
+    spec = importlib.util.spec_from_file_location("deco_sim", DECO_SIM_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["deco_sim"] = module
+    spec.loader.exec_module(module)
+    yield module
+    sys.modules.pop("deco_sim", None)
+
+
+def test_sweep_matches_single_simulations(deco_sim):
+    gammas, t_maxes = [0.1, 0.5, 1.0], [2.0, 6.0]
+    sweep = deco_sim.sweep_analytical(gammas, t_maxes, samples=32)
+    assert sweep.magnitude.shape == (3, 2, 32) and sweep.magnitude.dtype == np.float32
+    for i, gamma in enumerate(gammas):
+        for j, t_max in enumerate(t_maxes):
+            single = deco_sim.simulate_analytical(deco_sim.PhaseDampingConfig(gamma, t_max, 32))
+            assert np.allclose(sweep.magnitude[i, j], np.abs(single.rho01), atol=1e-6)
+
+
+def test_export_table_layout_and_sidecar(deco_sim, tmp_path):
+    sweep = deco_sim.sweep_analytical([0.1, 0.2], [1.0, 2.0, 3.0], samples=4)
+    raw = deco_sim.export_table(sweep, tmp_path / "lut.f32", fmt="f32")
+    table = np.fromfile(raw, dtype="<f4").reshape(2, 3, 4)
+    assert np.array_equal(table, sweep.magnitude)
+    metadata = json.loads((tmp_path / "lut.json").read_text())
+    assert (metadata["width"], metadata["height"], metadata["depth"]) == (4, 3, 2)
+    assert metadata["layout"] == ["gamma", "t_max", "sample"]
+
+    written = deco_sim.export_table(sweep, tmp_path / "lut", fmt="npy")
+    assert written == tmp_path / "lut.npy" and written.exists()
+    assert np.array_equal(np.load(written), sweep.magnitude)
+
+
+def test_cli_default_output_follows_format(deco_sim, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    deco_sim.main(["--sweep", "--gamma", "0.1", "0.2", "2", "--t-max", "1", "2", "2", "--samples", "4", "--format", "f32"])
+    assert (tmp_path / "decoherence_lut.f32").stat().st_size == 2 * 2 * 4 * 4
+    assert not (tmp_path / "decoherence_lut.npy").exists()
+
+
+def test_qutip_sweep_agrees_with_analytical(deco_sim):
+    pytest.importorskip("qutip")
+    assert deco_sim.mesolve is not None
+    qutip_sweep = deco_sim.sweep_with_qutip([0.2, 0.6], [3.0], samples=16, workers=2)
+    analytical = deco_sim.sweep_analytical([0.2, 0.6], [3.0], samples=16)
+    assert np.allclose(qutip_sweep.magnitude, analytical.magnitude, atol=1e-4)
@@ -0,0 +1,47 @@
+import csv
+
+from src.ingestion.entity_graph import build_entity_graph
+from src.ingestion.transcript_parser import parse_transcript_columns
+
+
+TRANSCRIPT = {
+    "segments": [
+        {"timestamp": 0.0, "text": "Dave debated Nick in Austin."},
+        {"timestamp": 5.0, "text": "Dave thanked Nick."},
+        {"timestamp": 70.0, "text": "Austin hosted Tucker."},
+    ]
+}
+
+
+def test_build_entity_graph_counts_segment_co_occurrence(tmp_path):
+    graph = build_entity_graph([TRANSCRIPT])
+    assert graph.neighbors("Dave") == [("Nick", 2), ("Austin", 1)]
+    assert graph.centrality("degree", k=1) == [("Dave", 3.0)]
+    assert graph.centrality("pagerank", k=1)[0][0] in {"Dave", "Nick", "Austin"}
+
+    nodes_path, edges_path = graph.export_neo4j_csv(tmp_path)
+    with edges_path.open() as handle:
+        edges = list(csv.DictReader(handle))
+    assert len(edges) == 4
+    assert nodes_path.read_text().splitlines()[0] == "entityId:ID(Entity),name,mentions:long,:LABEL"
+
+
+def test_build_entity_graph_windows_span_segments():
+    graph = build_entity_graph([TRANSCRIPT], window=60.0)
+    assert dict(graph.neighbors("Dave")) == {"Nick": 1, "Austin": 1}
+    assert graph.neighbors("Tucker") == [("Austin", 1)]
+
+
+def test_windows_carry_unparseable_timestamps_and_accept_columns():
+    transcript = {
+        "segments": [
+            {"timestamp": 0.0, "text": "Dave debated Nick."},
+            {"timestamp": "00:01:05", "text": "Austin cheered."},
+            {"timestamp": None, "text": "Tucker arrived."},
+            {"timestamp": 70.0, "text": "Nick left."},
+        ]
+    }
+    graph = build_entity_graph([parse_transcript_columns(transcript)], window=60.0)
+    assert dict(graph.neighbors("Tucker")) == {"Dave": 1, "Nick": 1, "Austin": 1}
+    assert build_entity_graph([transcript], window=60.0).neighbors("Tucker") == graph.neighbors("Tucker")
+    assert build_entity_graph([{"segments": []}]).centrality("pagerank") == []
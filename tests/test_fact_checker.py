@@ -1,4 +1,5 @@
-from src.ingestion.fact_checker import collect_claims
+from src.ingestion.fact_checker import Claim, collect_claim_records, collect_claims
+from src.ingestion.transcript_parser import parse_transcript_columns
 
 
 def test_collect_claims_flags_text_with_triggers():
@@ -11,3 +12,15 @@ def test_collect_claims_flags_text_with_triggers():
     claims = collect_claims(transcript)
     assert len(claims) == 1
     assert claims[0]["speaker"] == "Dave"
+
+
+def test_collect_claim_records_accepts_columns():
+    transcript = {
+        "segments": [
+            {"speaker": "Dave", "timestamp": 5, "text": "A new study says otherwise."},
+            {"speaker": "Nick", "timestamp": 7, "text": "Opinionated statement."},
+        ]
+    }
+    records = collect_claim_records(parse_transcript_columns(transcript))
+    assert records == [Claim("Dave", 5.0, "A new study says otherwise.")]
+    assert collect_claims(parse_transcript_columns(transcript)) == collect_claims(transcript)
@@ -0,0 +1,163 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pytest
+
+from src.deployment import jobs
+from src.deployment.jobs import JobManager, QueueFull
+
+RELEASE = threading.Event()
+ORDER = []
+
+
+def recording_job(params, context):
+    if params.get("block"):
+        RELEASE.wait(timeout=5)
+    ORDER.append(params["name"])
+    context.report(0.5, "halfway")
+    return {"name": params["name"]}
+
+
+def _wait(manager, job_id, statuses=jobs.TERMINAL_STATES):
+    deadline = time.time() + 5
+    while manager.status(job_id)["status"] not in statuses:
+        assert time.time() < deadline
+        time.sleep(0.01)
+    return manager.status(job_id)
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    monkeypatch.setitem(jobs.JOB_HANDLERS, "record", "test_jobs:recording_job")
+    RELEASE.clear()
+    ORDER.clear()
+    manager = JobManager(tmp_path, max_workers=1, max_queue=3, executor_factory=ThreadPoolExecutor)
+    yield manager
+    RELEASE.set()
+    manager.shutdown()
+
+
+def test_jobs_run_by_priority_and_persist_results(manager, tmp_path):
+    blocker = manager.submit("record", {"name": "blocker", "block": True})
+    _wait(manager, blocker, {"running"})
+    low = manager.submit("record", {"name": "low"}, priority=0)
+    high = manager.submit("record", {"name": "high"}, priority=5)
+    RELEASE.set()
+    assert _wait(manager, low)["status"] == "succeeded"
+    assert _wait(manager, high)["progress"] == 1.0
+    assert ORDER == ["blocker", "high", "low"]
+    assert JobManager(tmp_path).result(blocker) == {"name": "blocker"}
+
+
+def test_queued_jobs_can_be_cancelled_and_queue_is_bounded(manager):
+    _wait(manager, manager.submit("record", {"name": "blocker", "block": True}), {"running"})
+    queued = [manager.submit("record", {"name": str(i)}) for i in range(3)]
+    with pytest.raises(QueueFull):
+        manager.submit("record", {"name": "overflow"})
+    assert manager.cancel(queued[0])["status"] == "cancelled"
+    RELEASE.set()
+    assert _wait(manager, queued[1])["status"] == "succeeded"
+    assert "0" not in ORDER
+    with pytest.raises(LookupError):
+        manager.result(queued[0])
+
+
+def test_job_file_params_must_stay_under_data_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("JOB_DATA_DIR", str(tmp_path / "data"))
+    manager = JobManager(tmp_path / "jobs", executor_factory=ThreadPoolExecutor)
+    for outside in ("../secrets.json", "/etc/passwd"):
+        with pytest.raises(ValueError, match="outside the job data directory"):
+            manager.submit("analyze_transcript", {"input_path": outside})
+    assert jobs.resolve_data_path("raw/episode.json") == (tmp_path / "data" / "raw" / "episode.json").resolve()
+    manager.shutdown()
+
+
+class BrokenOnceExecutor(ThreadPoolExecutor):
+    created = []
+
+    def __init__(self, workers):
+        super().__init__(workers)
+        BrokenOnceExecutor.created.append(self)
+
+    def submit(self, *args, **kwargs):
+        if len(BrokenOnceExecutor.created) == 1:
+            raise BrokenProcessPool("worker was killed")
+        return super().submit(*args, **kwargs)
+
+
+def test_broken_pool_fails_the_job_and_is_replaced(tmp_path, monkeypatch):
+    monkeypatch.setitem(jobs.JOB_HANDLERS, "record", "test_jobs:recording_job")
+    BrokenOnceExecutor.created.clear()
+    manager = JobManager(tmp_path / "broken", max_workers=1, executor_factory=BrokenOnceExecutor)
+    failed = manager.submit("record", {"name": "first"})
+    assert _wait(manager, failed)["error"] == "BrokenProcessPool: worker was killed"
+    assert _wait(manager, manager.submit("record", {"name": "second"}))["status"] == "succeeded"
+    assert len(BrokenOnceExecutor.created) == 2
+    manager.shutdown()
+
+
+def test_concurrent_record_updates_never_resurrect_finished_jobs(manager):
+    job_id = manager.submit("record", {"name": "done"})
+    assert _wait(manager, job_id)["status"] == "succeeded"
+
+    def hammer(index):
+        for _ in range(50):
+            manager._update_record(job_id, only_active=True, cancel_requested=True)
+            manager._update_record(job_id, **{f"writer_{index}": True})
+
+    threads = [threading.Thread(target=hammer, args=(index,)) for index in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    record = manager.status(job_id)
+    assert record["status"] == "succeeded" and "cancel_requested" not in record
+    assert all(record[f"writer_{index}"] for index in range(8))
+
+
+def test_job_paths_cannot_target_job_state(tmp_path, monkeypatch):
+    monkeypatch.setenv("JOB_DATA_DIR", str(tmp_path))
+    manager = JobManager(tmp_path / "jobs", executor_factory=ThreadPoolExecutor)
+    with pytest.raises(ValueError, match="job state directory"):
+        manager.submit("train_axes", {"data_path": "spec.json", "output_path": "jobs/other.result"})
+    manager.shutdown()
+
+
+def test_train_axes_checks_for_cancellation_between_axes(tmp_path, monkeypatch):
+    from src.models import ideology_mapper
+
+    class Encoder:
+        def encode(self, sentences):
+            return np.ones((len(sentences), 2))
+
+    monkeypatch.setenv("JOB_DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(ideology_mapper, "load_sentence_encoder", lambda *args, **kwargs: Encoder())
+    axes = [{"name": name, "positive_examples": ["a"], "negative_examples": ["b"]} for name in ("x", "y")]
+    (tmp_path / "spec.json").write_text(json.dumps({"axes": axes}))
+    context = jobs.JobContext(tmp_path / "jobs", "job")
+    context.jobs_dir.mkdir()
+    monkeypatch.setattr(
+        ideology_mapper.IdeologyMapper, "add_axis", lambda self, *args: (context.jobs_dir / "job.cancel").touch()
+    )
+    with pytest.raises(jobs.JobCancelled):
+        jobs.train_axes_job({"data_path": "spec.json", "output_path": "axes.json"}, context)
+    assert not (tmp_path / "axes.json").exists()
+
+
+def test_recover_requeues_orphaned_jobs_and_fails_interrupted_ones(tmp_path, monkeypatch):
+    monkeypatch.setitem(jobs.JOB_HANDLERS, "record", "test_jobs:recording_job")
+    tmp_path.joinpath("jobs").mkdir()
+    for job_id, status in (("orphan", "queued"), ("interrupted", "running")):
+        record = {"id": job_id, "kind": "record", "params": {"name": job_id}, "priority": 0, "status": status}
+        (tmp_path / "jobs" / f"{job_id}.json").write_text(json.dumps(record))
+
+    manager = JobManager(tmp_path / "jobs", max_workers=1, executor_factory=ThreadPoolExecutor)
+    assert manager.recover() == ["orphan"]
+    assert _wait(manager, "orphan")["status"] == "succeeded"
+    assert manager.status("interrupted")["status"] == "failed"
+    assert manager.recover() == []
+    manager.shutdown()
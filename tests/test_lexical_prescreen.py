@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from src.models.ideology_mapper import IdeologyAxis, IdeologyMapper
+from src.models.lexical_prescreen import LexicalPrescreen
+
+IDEOLOGICAL = {"war": [1.0, 0.0], "borders": [0.0, 1.0], "peace": [-1.0, 0.0]}
+
+
+class KeywordEncoder:
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, sentences):
+        self.encoded.extend(sentences)
+        rows = []
+        for sentence in sentences:
+            vector = np.array([0.0, 0.0, 1.0])
+            for word, direction in IDEOLOGICAL.items():
+                if word in sentence.lower():
+                    vector[:2] += direction
+            rows.append(vector)
+        return np.array(rows)
+
+
+def _mapper():
+    mapper = IdeologyMapper()
+    mapper._encoder = KeywordEncoder()
+    mapper.axes = {
+        "hawk": IdeologyAxis("hawk", np.array([1.0, 0.0, 0.0]), [], []),
+        "borders": IdeologyAxis("borders", np.array([0.0, 1.0, 0.0]), [], []),
+    }
+    return mapper
+
+
+CALIBRATION = [
+    "Thanks for having me.",
+    "Welcome to the show.",
+    "Great to be here.",
+    "We need war now.",
+    "Close the borders today.",
+    "Give peace a chance.",
+]
+
+
+def test_two_tier_encodes_only_flagged_quotes_and_tracks_full_positions():
+    mapper = _mapper()
+    mapper.fit_prescreen(CALIBRATION, alpha=0.1)
+    mapper._encoder.encoded.clear()
+
+    quotes = ["Thanks for having me.", "Welcome to the show.", "We need war now.", "Close the borders today."]
+    tiered = mapper.map_speaker(quotes, two_tier=True)
+    assert mapper._encoder.encoded == ["We need war now.", "Close the borders today."]
+
+    full = mapper.map_speaker(quotes)
+    for axis in full:
+        assert abs(tiered[axis] - full[axis]) < 0.2
+
+
+def test_two_tier_matches_full_mapping_when_every_quote_is_flagged():
+    mapper = _mapper()
+    mapper.fit_prescreen(CALIBRATION)
+    mapper.prescreen.threshold = -1.0
+    quotes = ["We need war now.", "Give peace a chance.", "Close the borders today."]
+    tiered = mapper.map_speaker(quotes, two_tier=True)
+    full = mapper.map_speaker(quotes)
+    assert tiered == {axis: float(value) for axis, value in full.items()}
+
+
+def test_sparse_fit_matches_closed_form_ridge():
+    projections = np.random.default_rng(0).normal(size=(len(CALIBRATION), 2))
+    prescreen = LexicalPrescreen(["a", "b"]).fit(CALIBRATION, projections, alpha=0.5)
+    features = prescreen.vectorizer.transform(CALIBRATION).toarray()
+    centred = projections - projections.mean(axis=0)
+    expected = features.T @ np.linalg.solve(features @ features.T + 0.5 * np.eye(len(features)), centred)
+    assert np.allclose(prescreen.weights, expected, atol=1e-6)
+
+
+def test_two_tier_rejects_non_positive_approximate_weight():
+    mapper = _mapper()
+    mapper.fit_prescreen(CALIBRATION)
+    with pytest.raises(ValueError, match="approximate_weight"):
+        mapper.map_speaker(["Thanks for having me."], two_tier=True, approximate_weight=0.0)
@@ -0,0 +1,43 @@
+import numpy as np
+
+from src.analysis.overton_shift import OvertonTracker, lttb_indices
+
+
+def _tracker():
+    tracker = OvertonTracker()
+    tracker.add_event("2024-01-01", "Tariffs are back", "x", "boos", "controversy")
+    tracker.add_event("2024-01-01", "Tariffs again", "x", "mixed", "debate")
+    tracker.add_event("2024-01-03", "Tariffs now", "x", "cheers", "consensus")
+    tracker.add_event("2024-01-02", "Tariffs on tv", "tv", "mixed", "debate")
+    tracker.add_event("2024-01-02", "Unrelated", "tv", "mixed", "consensus")
+    return tracker
+
+
+def test_resample_buckets_scores_per_platform():
+    buckets = _tracker().resample("tariffs", freq="daily", window=2)
+    x_rows = buckets.loc[buckets["platform"] == "x"]
+    assert list(x_rows["count"]) == [2, 1]
+    assert x_rows.iloc[0]["min"] == -0.3
+    assert x_rows.iloc[0]["max"] == 0.0
+    assert np.isclose(x_rows.iloc[1]["rolling_mean"], (-0.15 + 1.0) / 2)
+    assert list(buckets.loc[buckets["platform"] == "tv", "count"]) == [1]
+
+
+def test_lttb_keeps_endpoints_and_peak():
+    x = np.arange(100, dtype=float)
+    y = np.zeros(100)
+    y[37] = 5.0
+    indices = lttb_indices(x, y, 10)
+    assert len(indices) == 10
+    assert indices[0] == 0 and indices[-1] == 99
+    assert 37 in indices
+
+
+def test_plot_shift_caps_points_per_trace():
+    tracker = OvertonTracker()
+    for day in range(60):
+        tracker.add_event(f"2024-01-{day % 28 + 1:02d}", "Tariffs", "x", "", "debate")
+    figure = tracker.plot_shift("tariffs", max_points=10)
+    assert len(figure.data[0].x) == 10
+    figure = tracker.plot_shift("tariffs", freq="weekly")
+    assert len(figure.data) == 1
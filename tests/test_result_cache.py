@@ -0,0 +1,39 @@
+from fastapi.testclient import TestClient
+
+from src.deployment import api_server
+from src.deployment.result_cache import InMemoryBackend, ResultCache
+
+
+def test_keys_are_canonical_and_entries_expire():
+    now = [0.0]
+    cache = ResultCache(InMemoryBackend(clock=lambda: now[0]), ttl=10)
+    key = cache.key("tension", {"a": 1, "b": [1, 2]}, version="v1")
+    assert key == cache.key("tension", {"b": [1, 2], "a": 1}, version="v1")
+    assert key != cache.key("tension", {"a": 1, "b": [1, 2]}, version="v2")
+
+    cache.set(key, {"score": 0.5})
+    assert cache.get(key) == {"score": 0.5}
+    now[0] = 11.0
+    assert cache.get(key) is None
+
+    cache.backend.set(key, b"not zlib", ttl=10)
+    assert cache.get(key) is None
+
+
+def test_tension_endpoint_serves_repeat_requests_from_cache(monkeypatch):
+    monkeypatch.setattr(api_server, "result_cache", ResultCache(InMemoryBackend()))
+    calls = []
+    original = api_server.TensionDetector.analyze_exchange
+
+    def counting(self, a, b):
+        calls.append((a, b))
+        return original(self, a, b)
+
+    monkeypatch.setattr(api_server.TensionDetector, "analyze_exchange", counting)
+    client = TestClient(api_server.app)
+    payload = {"speaker_a": "You are a liar.", "speaker_b": "Fair point."}
+    first = client.post("/tension/detect", json=payload).json()
+    second = client.post("/tension/detect", json=payload).json()
+    assert first == second
+    assert first["triggers"] == ["liar"]
+    assert len(calls) == 1
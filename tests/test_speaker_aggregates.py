@@ -0,0 +1,67 @@
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from src.models.ideology_mapper import IdeologyAxis, IdeologyMapper
+from src.models.speaker_aggregates import SpeakerAggregateStore
+
+
+class LengthEncoder:
+    def __init__(self):
+        self.calls = 0
+
+    def encode(self, sentences):
+        self.calls += 1
+        return np.array([[len(sentence), 1.0] for sentence in sentences], dtype=float)
+
+
+def _mapper():
+    mapper = IdeologyMapper()
+    mapper._encoder = LengthEncoder()
+    mapper.axes = {"length": IdeologyAxis("length", np.array([1.0, 0.0]), [], [])}
+    return mapper
+
+
+def test_history_matches_full_reencoding_and_supports_ranges():
+    mapper = _mapper()
+    day_one = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    day_two = datetime(2024, 1, 2, 12, tzinfo=timezone.utc)
+    mapper.record_quotes("Dave", ["ab", "abcd"], [day_one, day_one])
+    mapper.record_quotes("Dave", ["abcdefghi"], [day_two])
+    assert mapper.map_speaker_history("Dave") == mapper.map_speaker(["ab", "abcd", "abcdefghi"])
+    assert mapper.map_speaker_history("Dave", end=datetime(2024, 1, 2, tzinfo=timezone.utc)) == {"length": 3.0}
+    assert [point["positions"]["length"] for point in mapper.ideology_drift("Dave")] == [3.0, 9.0]
+
+
+def test_store_round_trips_through_disk(tmp_path):
+    store = SpeakerAggregateStore()
+    store.add("Nick", np.array([[1.0, 2.0], [3.0, 4.0]]), [0.0, 90_000.0])
+    store.save(tmp_path / "aggregates.npz")
+    loaded = SpeakerAggregateStore.load(tmp_path / "aggregates.npz")
+    assert np.allclose(loaded.mean_embedding("Nick"), [2.0, 3.0])
+    assert np.allclose(loaded.mean_embedding("Nick", start=86_400), [3.0, 4.0])
+
+
+def test_unaligned_range_is_rejected():
+    store = SpeakerAggregateStore()
+    store.add("Nick", np.array([[1.0, 2.0], [3.0, 4.0]]), [0.0, 90_000.0])
+    with pytest.raises(ValueError, match="not aligned"):
+        store.mean_embedding("Nick", start=43_200, end=129_600)
+
+
+def test_naive_datetimes_are_bucketed_as_utc(monkeypatch):
+    import time
+
+    import pandas as pd
+
+    monkeypatch.setenv("TZ", "Europe/Berlin")
+    time.tzset()
+    try:
+        store = SpeakerAggregateStore()
+        store.add("A", np.array([[1.0], [3.0]]), [datetime(2024, 1, 1, 23, 30), pd.Timestamp("2024-01-02 00:30")])
+        assert np.allclose(store.mean_embedding("A", end=datetime(2024, 1, 2)), [1.0])
+        assert np.allclose(store.mean_embedding("A", start=pd.Timestamp("2024-01-02")), [3.0])
+    finally:
+        monkeypatch.undo()
+        time.tzset()
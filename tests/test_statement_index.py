@@ -0,0 +1,88 @@
+import zlib
+
+import numpy as np
+
+from src.models.statement_index import StatementIndex, benchmark_recall
+
+
+class HashEncoder:
+    def encode(self, sentences):
+        return np.stack(
+            [
+                np.random.default_rng(zlib.crc32(sentence.encode())).normal(size=16)
+                for sentence in sentences
+            ]
+        )
+
+
+def test_index_persists_inserts_and_finds_exact_statement(tmp_path):
+    index = StatementIndex(tmp_path, encoder=HashEncoder())
+    index.add_transcript(
+        {
+            "segments": [
+                {"speaker": "Dave", "timestamp": 1.0, "text": "Welcome to the show."},
+                {"speaker": "Nick", "timestamp": 2.0, "text": "Thanks for having me."},
+            ]
+        },
+        "episode-1",
+    )
+    reopened = StatementIndex(tmp_path, encoder=HashEncoder())
+    reopened.add_statements([{"speaker": "Dave", "timestamp": 3.0, "text": "Aid increased."}])
+    hit = reopened.search("Thanks for having me.", k=1)[0]
+    assert len(reopened) == 3
+    assert (hit.speaker, hit.transcript, hit.timestamp) == ("Nick", "episode-1", 2.0)
+
+
+def test_trained_index_routes_new_inserts_and_keeps_recall(tmp_path):
+    rng = np.random.default_rng(0)
+    index = StatementIndex(tmp_path)
+    vectors = rng.normal(size=(2000, 16))
+    index.add_vectors(vectors[:1500], [{"text": str(i)} for i in range(1500)])
+    index.train(n_lists=16)
+    index.add_vectors(vectors[1500:], [{"text": str(i)} for i in range(1500, 2000)])
+    assert index.search_vector(vectors[1900], k=1, n_probe=4)[0].statement_id == 1900
+    results = benchmark_recall(index, n_queries=50, probes=(4,))
+    assert results[0]["n_probe"] == 4 and results[0]["recall"] > 0.5
+
+
+def test_search_endpoint_reuses_index_until_files_change(tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    from src.deployment import api_server
+    from src.models import statement_index
+
+    monkeypatch.setattr(statement_index, "load_sentence_encoder", lambda *args, **kwargs: HashEncoder())
+    monkeypatch.setattr(api_server, "_statement_indexes", {})
+    monkeypatch.setenv("STATEMENT_INDEX_PATH", str(tmp_path))
+    StatementIndex(tmp_path).add_statements([{"speaker": "Dave", "text": "Welcome to the show."}])
+    client = TestClient(api_server.app)
+
+    response = client.post("/search/similar", json={"text": "Welcome to the show.", "k": 1})
+    assert response.status_code == 200
+    assert response.json()["results"][0]["speaker"] == "Dave"
+    opened = api_server._statement_indexes[str(tmp_path)][1]
+    client.post("/search/similar", json={"text": "Welcome to the show.", "k": 1})
+    assert api_server._statement_indexes[str(tmp_path)][1] is opened
+
+    StatementIndex(tmp_path).add_statements([{"speaker": "Nick", "text": "Thanks for having me."}])
+    response = client.post("/search/similar", json={"text": "Thanks for having me.", "k": 1})
+    assert response.json()["results"][0]["speaker"] == "Nick"
+    assert api_server._statement_indexes[str(tmp_path)][1] is not opened
+
+
+def test_interrupted_insert_is_truncated_on_reopen(tmp_path):
+    index = StatementIndex(tmp_path, encoder=HashEncoder())
+    index.add_statements([{"speaker": "Dave", "timestamp": "00:01:05", "text": "Welcome to the show."}])
+    # Simulate a crash after the vector and list writes of a second insert.
+    with (tmp_path / "vectors.f32").open("ab") as handle:
+        handle.write(np.zeros(16, dtype=np.float32).tobytes())
+    with (tmp_path / "lists.i32").open("ab") as handle:
+        handle.write(np.zeros(1, dtype=np.int32).tobytes())
+    with (tmp_path / "metadata.jsonl").open("a") as handle:
+        handle.write('{"speaker": "Ni')
+
+    reopened = StatementIndex(tmp_path, encoder=HashEncoder())
+    reopened.add_statements([{"speaker": "Nick", "timestamp": None, "text": "Thanks for having me."}])
+    hit = reopened.search("Thanks for having me.", k=1)[0]
+    assert (hit.statement_id, hit.speaker, hit.timestamp) == (1, "Nick", None)
+    assert reopened.search("Welcome to the show.", k=1)[0].timestamp == "00:01:05"
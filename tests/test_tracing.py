@@ -0,0 +1,58 @@
+import threading
+import time
+
+from fastapi.testclient import TestClient
+
+from src.deployment import api_server
+from src.models.tension_detector import TensionDetector
+from src.observability.profiler import sample_stacks, to_collapsed
+from src.observability.tracing import end_trace, span, start_trace
+
+
+def test_spans_are_recorded_only_inside_an_active_trace():
+    with span("outside"):
+        pass
+    trace, token = start_trace()
+    try:
+        TensionDetector().analyze_exchange("You liar.", "Fair point.")
+        with span("custom"):
+            time.sleep(0.001)
+    finally:
+        end_trace(token)
+    summary = trace.summary()
+    assert set(summary) == {"tension.attack_keywords", "tension.concession_keywords", "custom"}
+    assert summary["custom"]["ms"] >= 1.0
+    header = trace.server_timing()
+    assert header.startswith("tension.attack_keywords;dur=")
+    assert "total;dur=" in header
+
+
+def test_requests_carry_server_timing_header():
+    client = TestClient(api_server.app)
+    response = client.post("/tension/detect", json={"speaker_a": "a", "speaker_b": "b"})
+    assert "tension.attack_keywords;dur=" in response.headers["Server-Timing"]
+    assert "total;dur=" in response.headers["Server-Timing"]
+
+
+def test_profile_endpoint_requires_admin_token(monkeypatch):
+    client = TestClient(api_server.app)
+    assert client.get("/admin/profile", params={"seconds": 0.05}).status_code == 403
+    monkeypatch.setenv("ADMIN_TOKEN", "secret")
+    denied = client.get("/admin/profile", params={"seconds": 0.05}, headers={"X-Admin-Token": "nope"})
+    assert denied.status_code == 403
+    response = client.get("/admin/profile", params={"seconds": 0.1}, headers={"X-Admin-Token": "secret"})
+    assert response.status_code == 200
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in response.text.splitlines())
+
+
+def test_collapsed_output_counts_sampled_stacks():
+    stop = threading.Event()
+    worker = threading.Thread(target=stop.wait, name="sampled-worker")
+    worker.start()
+    try:
+        lines = to_collapsed(sample_stacks(0.05, interval=0.005)).splitlines()
+    finally:
+        stop.set()
+        worker.join()
+    assert any(line.startswith("sampled-worker;") for line in lines)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
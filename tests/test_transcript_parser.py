@@ -1,4 +1,6 @@
-from src.ingestion.transcript_parser import parse_transcript
+import math
+
+from src.ingestion.transcript_parser import parse_transcript, parse_transcript_columns
 
 
 def test_parse_transcript_normalizes_segments():
@@ -11,3 +13,49 @@ def test_parse_transcript_normalizes_segments():
     normalized = parse_transcript(raw)
     assert normalized["segments"][0]["speaker"] == "A"
     assert normalized["segments"][1]["text"] == "Hi there"
+
+
+def test_parse_transcript_columns_packs_segments():
+    raw = {
+        "segments": [
+            {"speaker": "A", "timestamp": 1, "text": "Hello"},
+            {"speaker": "A", "timestamp": 2.5, "text": "Again"},
+            {"text": "Anonymous"},
+        ]
+    }
+    columns = parse_transcript_columns(raw)
+    assert len(columns) == 3
+    assert columns.speakers[0] is columns.speakers[1]
+    assert columns.timestamps.typecode == "d"
+    assert list(columns)[2] == ("unknown", 0.0, "Anonymous")
+    assert columns.to_dict() == parse_transcript(raw)
+    assert not hasattr(columns, "__dict__")
+
+
+def test_parse_transcript_columns_keeps_non_numeric_timestamps():
+    raw = {
+        "segments": [
+            {"speaker": "A", "timestamp": "00:01:05", "text": "Clock time"},
+            {"speaker": "B", "timestamp": None, "text": "Missing"},
+            {"speaker": "A", "timestamp": 7, "text": "Seconds"},
+        ]
+    }
+    columns = parse_transcript_columns(raw)
+    assert math.isnan(columns.timestamps[0]) and math.isnan(columns.timestamps[1])
+    assert [segment["timestamp"] for segment in columns.to_dict()["segments"]] == ["00:01:05", None, 7.0]
+
+
+def test_parse_transcript_columns_round_trips_like_parse_transcript():
+    raw = {
+        "segments": [
+            {"speaker": None, "timestamp": "15", "text": "String seconds"},
+            {"speaker": 3, "timestamp": True, "text": "Flag"},
+            {"speaker": "A", "timestamp": "nan", "text": "Not a number"},
+            {"speaker": "A", "timestamp": 15, "text": "Int seconds"},
+        ]
+    }
+    columns = parse_transcript_columns(raw)
+    assert columns.to_dict() == parse_transcript(raw)
+    assert columns.speakers[:2] == [None, 3]
+    assert [type(segment["timestamp"]) for segment in columns.to_dict()["segments"]] == [str, bool, str, int]
+    assert math.isnan(columns.timestamps[1]) and columns.timestamps[3] == 15.0